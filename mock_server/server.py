@@ -0,0 +1,403 @@
+"""
+MockAqxServer - Local stand-in for the AQX Trader web app
+Serves a login page and a trade page carrying the same data-testids, names and
+texts the Page Objects use, backed by a simulated order book (deterministic
+prices), open positions, pending orders and notifications. Every API call can
+be delayed by a configurable latency.
+
+Run standalone:
+    python -m mock_server.server --port 8765 --latency 0.05
+"""
+
+import argparse
+import json
+import math
+import os
+import secrets
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+SESSION_COOKIE = "aqx_session"
+
+# Symbol -> (base price, digits)
+SYMBOLS = {
+    "XAUUSD": (2650.00, 2),
+    "XAGUSD": (31.20, 3),
+    "EURUSD": (1.0850, 5),
+    "GBPUSD": (1.2700, 5),
+    "USDJPY": (149.50, 3),
+    "BTCUSD": (67000.00, 2),
+}
+
+ORDER_TYPES = ("Market", "Limit", "Stop", "Stop Limit")
+EXPIRY_TYPES = ("Good Till Canceled", "Good Till Day", "Specified Date", "Specified Date and Time")
+
+
+def quote(symbol, at=None):
+    """
+    Deterministic simulated price of a symbol at a point in time
+
+    Returns:
+        dict: {"bid", "ask", "last"} rounded to the symbol's digits
+    """
+    base, digits = SYMBOLS[symbol]
+    t = time.time() if at is None else at
+    phase = zlib.crc32(symbol.encode()) % 360
+    mid = base * (1 + 0.002 * math.sin(t / 7.0 + phase) + 0.0007 * math.sin(t / 1.3 + phase))
+    spread = base * 0.0001
+    return {
+        "bid": round(mid - spread / 2, digits),
+        "ask": round(mid + spread / 2, digits),
+        "last": round(mid, digits),
+    }
+
+
+class Account:
+    """Simulated trading account: positions, pending orders, history, notifications"""
+
+    def __init__(self, first_order_id=100001):
+        self.lock = threading.Lock()
+        self.next_order_id = first_order_id
+        self.positions = []
+        self.pending = []
+        self.history = []
+        self.notifications = []
+
+    def _notify(self, title, order, price, profit=None):
+        self.notifications.insert(0, {
+            "title": title,
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "order_id": order["order_id"],
+            "symbol": order["symbol"],
+            "type": order["type"],
+            "volume": order["volume"],
+            "profit": profit,
+            "price": price,
+        })
+
+    def place(self, payload):
+        """Validate and place an order; returns (order, error)"""
+        symbol = str(payload.get("symbol", "")).upper()
+        side = str(payload.get("side", "")).upper()
+        order_type = payload.get("order_type") or "Market"
+        if symbol not in SYMBOLS:
+            return None, "Invalid symbol"
+        if side not in ("BUY", "SELL"):
+            return None, "Invalid side"
+        if order_type not in ORDER_TYPES:
+            return None, "Invalid order type"
+        try:
+            volume = float(payload.get("volume"))
+        except (TypeError, ValueError):
+            return None, "Invalid volume"
+        if volume <= 0:
+            return None, "Invalid volume"
+
+        q = quote(symbol)
+        digits = SYMBOLS[symbol][1]
+        entry = q["ask"] if side == "BUY" else q["bid"]
+        with self.lock:
+            order = {
+                "order_id": str(self.next_order_id),
+                "open_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "symbol": symbol,
+                "type": side,
+                "order_type": order_type,
+                "volume": f"{volume:.2f}",
+                "units": str(int(round(volume * 100))),
+                "entry": f"{entry:.{digits}f}",
+                "tp": _fmt_price(payload.get("tp"), digits),
+                "sl": _fmt_price(payload.get("sl"), digits),
+                "swap": "0.00",
+                "comment": "",
+                "expiry": payload.get("expiry") or "Good Till Canceled",
+                "expiry_date": payload.get("expiry_date") or "",
+                "expiry_time": payload.get("expiry_time") or "",
+            }
+            self.next_order_id += 1
+            if order_type == "Market":
+                self.positions.insert(0, order)
+                self._notify("Market Order Opened", order, order["entry"])
+            else:
+                self.pending.insert(0, order)
+                self._notify(f"{order_type} Order Placed", order, order["entry"])
+        return order, None
+
+    def edit(self, order_id, payload):
+        with self.lock:
+            order = self._find(order_id)
+            if order is None:
+                return None, "Order not found"
+            digits = SYMBOLS[order["symbol"]][1]
+            if payload.get("volume") not in (None, ""):
+                try:
+                    order["volume"] = f"{float(payload['volume']):.2f}"
+                except ValueError:
+                    return None, "Invalid volume"
+            if payload.get("sl") not in (None, ""):
+                order["sl"] = _fmt_price(payload["sl"], digits)
+            if payload.get("tp") not in (None, ""):
+                order["tp"] = _fmt_price(payload["tp"], digits)
+            self._notify("Order Modified", order, order["entry"])
+            return order, None
+
+    def close(self, order_id):
+        with self.lock:
+            for table, title in ((self.positions, "Position Closed"), (self.pending, "Pending Order Cancelled")):
+                for order in table:
+                    if order["order_id"] == order_id:
+                        table.remove(order)
+                        profit = profit_of(order) if table is self.positions else None
+                        self.history.insert(0, dict(order, profit=profit,
+                                                    close_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                        self._notify(title, order, current_price(order), profit)
+                        return order, None
+        return None, "Order not found"
+
+    def bulk_close(self, kind):
+        table = self.pending if kind == "pending" else self.positions
+        closed = []
+        for order in list(table):
+            order, _ = self.close(order["order_id"])
+            if order:
+                closed.append(order["order_id"])
+        return closed
+
+    def _find(self, order_id):
+        for order in self.positions + self.pending:
+            if order["order_id"] == order_id:
+                return order
+        return None
+
+    def snapshot(self):
+        """JSON-serializable account state with live prices and P/L"""
+        with self.lock:
+            positions = [dict(o, current=current_price(o), profit=profit_of(o)) for o in self.positions]
+            pending = [dict(o, current=current_price(o), profit="") for o in self.pending]
+            return {
+                "positions": positions,
+                "pending": pending,
+                "history": list(self.history),
+                "notifications": list(self.notifications),
+            }
+
+
+def _fmt_price(value, digits):
+    try:
+        return f"{float(value):.{digits}f}"
+    except (TypeError, ValueError):
+        return "-"
+
+
+def current_price(order):
+    q = quote(order["symbol"])
+    digits = SYMBOLS[order["symbol"]][1]
+    return f"{(q['bid'] if order['type'] == 'BUY' else q['ask']):.{digits}f}"
+
+
+def profit_of(order):
+    diff = float(current_price(order)) - float(order["entry"])
+    if order["type"] == "SELL":
+        diff = -diff
+    return f"{diff * float(order['units']):+.2f}"
+
+
+class MockAqxServer:
+    """
+    Threaded HTTP server hosting the mock AQX Trader app
+
+    Usage:
+        server = MockAqxServer(username="1001186", password="secret").start()
+        os.environ["AQX_BASE_URL"] = server.base_url
+        ...
+        server.stop()
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, tick=0.5,
+                 username=None, password=None):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            latency: Seconds added to every API call
+            tick: Seconds between price refreshes on the trade page
+            username: Accepted login (default TEST_USERNAME env or "1001186")
+            password: Accepted password (default TEST_PASSWORD env or "password")
+        """
+        self.latency = latency
+        self.tick = tick
+        self.username = username or os.getenv("TEST_USERNAME", "1001186")
+        self.password = password or os.getenv("TEST_PASSWORD", "password")
+        self.sessions = {}
+        self.accounts = {}
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def account(self, username):
+        if username not in self.accounts:
+            self.accounts[username] = Account()
+        return self.accounts[username]
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"[✓] Mock AQX server running at {self.base_url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self):
+        print(f"[✓] Mock AQX server running at {self.base_url}")
+        self._httpd.serve_forever()
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        # ---------- helpers ----------
+
+        def _username(self):
+            jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+            token = jar[SESSION_COOKIE].value if SESSION_COOKIE in jar else None
+            return server.sessions.get(token)
+
+        def _send(self, status, body, content_type="application/json", headers=None):
+            if isinstance(body, (dict, list)):
+                body = json.dumps(body)
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _redirect(self, location):
+            self._send(302, b"", "text/plain", {"Location": location})
+
+        def _static(self, name, content_type):
+            with open(os.path.join(STATIC_DIR, name), "rb") as f:
+                body = f.read()
+            if name.endswith(".html"):
+                body = body.replace(b"__TICK_MS__", str(int(server.tick * 1000)).encode())
+            self._send(200, body, content_type)
+
+        def _json_body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if not length:
+                return {}
+            try:
+                return json.loads(self.rfile.read(length))
+            except ValueError:
+                return {}
+
+        # ---------- routes ----------
+
+        def do_GET(self):
+            path = urlparse(self.path).path.rstrip("/") or "/"
+            if path in ("/", "/web", "/web/login"):
+                if path != "/web/login" and self._username():
+                    return self._redirect("/web/trade")
+                return self._static("login.html", "text/html; charset=utf-8")
+            if path == "/web/trade":
+                if not self._username():
+                    return self._redirect("/web/login")
+                return self._static("trade.html", "text/html; charset=utf-8")
+            if path in ("/static/trade.js", "/static/style.css"):
+                kind = "application/javascript" if path.endswith(".js") else "text/css"
+                return self._static(path.rsplit("/", 1)[-1], kind)
+            if path == "/favicon.ico":
+                return self._send(204, b"", "image/x-icon")
+            if path.startswith("/api/"):
+                return self._api("GET", path, {})
+            self._send(404, {"error": "Not found"})
+
+        def do_POST(self):
+            path = urlparse(self.path).path.rstrip("/")
+            self._api("POST", path, self._json_body())
+
+        def _api(self, method, path, payload):
+            if server.latency:
+                time.sleep(server.latency)
+
+            if path == "/api/login" and method == "POST":
+                if payload.get("userId") == server.username and payload.get("password") == server.password:
+                    token = secrets.token_hex(16)
+                    server.sessions[token] = server.username
+                    return self._send(200, {"token": token, "userId": server.username},
+                                      headers={"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; SameSite=Lax"})
+                return self._send(401, {"error": "Invalid credentials"})
+
+            username = self._username()
+            if not username:
+                return self._send(401, {"error": "Session expired"})
+            account = server.account(username)
+
+            if path == "/api/quote" and method == "GET":
+                return self._send(200, {s: quote(s) for s in SYMBOLS})
+            if path == "/api/state" and method == "GET":
+                state = account.snapshot()
+                state["quotes"] = {s: quote(s) for s in SYMBOLS}
+                state["server_date"] = datetime.now().strftime("%Y-%m-%d")
+                state["tomorrow"] = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+                return self._send(200, state)
+            if path == "/api/orders" and method == "POST":
+                order, error = account.place(payload)
+                return self._send(400 if error else 200, {"error": error} if error else order)
+            if path.startswith("/api/orders/") and method == "POST":
+                parts = path.split("/")
+                if len(parts) == 5 and parts[4] == "close":
+                    order, error = account.close(parts[3])
+                elif len(parts) == 5 and parts[4] == "edit":
+                    order, error = account.edit(parts[3], payload)
+                else:
+                    return self._send(404, {"error": "Not found"})
+                return self._send(404 if error else 200, {"error": error} if error else order)
+            if path == "/api/bulk-close" and method == "POST":
+                return self._send(200, {"closed": account.bulk_close(payload.get("kind", "positions"))})
+            if path == "/api/logout" and method == "POST":
+                server.sessions = {t: u for t, u in server.sessions.items() if u != username}
+                return self._send(200, {})
+            self._send(404, {"error": "Not found"})
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the AQX Trader web app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every API call")
+    parser.add_argument("--tick", type=float, default=0.5, help="seconds between price refreshes")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    args = parser.parse_args()
+    MockAqxServer(args.host, args.port, args.latency, args.tick, args.username, args.password).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
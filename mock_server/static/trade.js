@@ -0,0 +1,395 @@
+/*
+ * Mock AQX Trader - trade page
+ * Keyed, in-place rendering (like the real React app): live price ticks only
+ * change text nodes, rows and items are reused across refreshes.
+ */
+(function () {
+    'use strict';
+
+    var ORDER_TYPES = ['Market', 'Limit', 'Stop', 'Stop Limit'];
+    var EXPIRY_TYPES = ['Good Till Canceled', 'Good Till Day', 'Specified Date', 'Specified Date and Time'];
+    var HEADERS = ['Open Date', 'Order No.', 'Symbol', 'Type', 'Profit/Loss', 'Volume', 'Units', 'Entry Price',
+                   'Current Price', 'Take Profit', 'Stop Loss', 'Swap', 'Comment', 'Track', 'Edit', 'Close'];
+    var FIELDS = ['open_date', 'order_id', 'symbol', 'type', 'profit', 'volume', 'units', 'entry',
+                  'current', 'tp', 'sl', 'swap', 'comment'];
+    var ITEM_HEIGHT = 120;
+
+    var state = {positions: [], pending: [], history: [], notifications: [], quotes: {}};
+    var ui = {symbol: 'XAUUSD', side: 'BUY', orderType: 'Market', expiry: 'Good Till Day', tab: 'positions', prices: []};
+
+    function $(sel) { return document.querySelector(sel); }
+
+    function el(tag, attrs, text) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (k) { node.setAttribute(k, attrs[k]); });
+        if (text !== undefined) node.textContent = text;
+        return node;
+    }
+
+    function setText(node, text) {
+        text = text === undefined || text === null || text === '' ? '-' : String(text);
+        if (node.textContent !== text) node.textContent = text;
+    }
+
+    function api(method, path, body) {
+        return fetch(path, {
+            method: method,
+            headers: {'Content-Type': 'application/json'},
+            body: body ? JSON.stringify(body) : undefined
+        }).then(function (res) {
+            if (res.status === 401) { window.location.href = '/web/login'; throw new Error('Session expired'); }
+            return res.json().then(function (data) { return {ok: res.ok, data: data}; });
+        });
+    }
+
+    function toast(message, isError) {
+        var node = el('div', {'class': isError ? 'toast error' : 'toast'}, message);
+        $('#toast-root').appendChild(node);
+        setTimeout(function () { node.remove(); }, 2500);
+    }
+
+    // ---------------- symbol search ----------------
+
+    $('#symbol-input').addEventListener('input', function (event) {
+        var query = event.target.value.trim().toUpperCase();
+        var slot = $('#symbol-results-slot');
+        slot.innerHTML = '';
+        if (!query) return;
+        var matches = Object.keys(state.quotes).filter(function (s) { return s.indexOf(query) >= 0; });
+        if (!matches.length) return;
+        var list = el('div', {'class': 'sc-197e9882-0 kJjEOX'});
+        matches.forEach(function (symbol) { list.appendChild(el('div', {'data-symbol': symbol}, symbol)); });
+        slot.appendChild(list);
+    });
+
+    $('#symbol-results-slot').addEventListener('click', function (event) {
+        var symbol = event.target.getAttribute('data-symbol');
+        if (!symbol) return;
+        ui.symbol = symbol;
+        ui.prices = [];
+        $('#symbol-input').value = symbol;
+        setText($('[data-testid="symbol-overview-id"]'), symbol);
+        $('#symbol-results-slot').innerHTML = '';
+        renderPrice();
+    });
+
+    // ---------------- order ticket ----------------
+
+    function setSide(side) {
+        ui.side = side;
+        $('[data-testid="trade-button-order-buy"]').classList.toggle('active', side === 'BUY');
+        $('[data-testid="trade-button-order-sell"]').classList.toggle('active', side === 'SELL');
+    }
+    $('[data-testid="trade-button-order-buy"]').addEventListener('click', function () { setSide('BUY'); });
+    $('[data-testid="trade-button-order-sell"]').addEventListener('click', function () { setSide('SELL'); });
+
+    function buildOptions(container, values, onPick) {
+        values.forEach(function (value) { container.appendChild(el('div', {'data-value': value}, value)); });
+        container.addEventListener('click', function (event) {
+            var value = event.target.getAttribute('data-value');
+            if (!value) return;
+            container.hidden = true;
+            onPick(value);
+        });
+    }
+
+    function setOrderType(value) {
+        ui.orderType = value;
+        $('#order-type-value').textContent = value;
+        $('#expiry-block').hidden = value === 'Market';
+    }
+
+    function setExpiry(value) {
+        ui.expiry = value;
+        $('#expiry-value').textContent = value;
+        $('[data-testid="trade-input-expiry-date"]').hidden = value.indexOf('Specified Date') !== 0;
+        $('[data-testid="trade-input-expiry-time"]').hidden = value !== 'Specified Date and Time';
+    }
+
+    buildOptions($('#order-type-options'), ORDER_TYPES, setOrderType);
+    buildOptions($('#expiry-options'), EXPIRY_TYPES, setExpiry);
+    $('#order-type-select').addEventListener('click', function () {
+        $('#order-type-options').hidden = !$('#order-type-options').hidden;
+    });
+    $('#expiry-select').addEventListener('click', function () {
+        $('#expiry-options').hidden = !$('#expiry-options').hidden;
+    });
+
+    ['trade-input-expiry-date', 'trade-input-expiry-time'].forEach(function (testid) {
+        var box = $('[data-testid="' + testid + '"]');
+        box.querySelector('div').addEventListener('click', function () { box.querySelector('input').focus(); });
+        box.querySelector('input').addEventListener('keydown', function (event) {
+            if (event.key === 'Enter') event.target.blur();
+        });
+    });
+
+    function resetTicket() {
+        setOrderType('Market');
+        setExpiry('Good Till Day');
+        document.querySelector('input[name="stopLoss"]').value = '';
+        document.querySelector('input[name="takeProfit"]').value = '';
+        $('#expiry-date').value = '';
+        $('#expiry-time').value = '';
+    }
+
+    $('[data-testid="trade-button-order"]').addEventListener('click', function () {
+        var payload = {
+            symbol: ui.symbol,
+            side: ui.side,
+            order_type: ui.orderType,
+            volume: document.querySelector('input[name="lotSize"]').value,
+            sl: document.querySelector('input[name="stopLoss"]').value,
+            tp: document.querySelector('input[name="takeProfit"]').value,
+            expiry: ui.orderType === 'Market' ? null : ui.expiry,
+            expiry_date: $('#expiry-date').value,
+            expiry_time: $('#expiry-time').value
+        };
+        api('POST', '/api/orders', payload).then(function (res) {
+            if (!res.ok) { toast(res.data.error || 'Order failed', true); return; }
+            toast('Order placed successfully');
+            resetTicket();
+            refresh();
+        });
+    });
+
+    // ---------------- tables ----------------
+
+    var tableEl = $('#table');
+    var rowsByOrder = {};
+    var renderedTab = null;
+
+    function rowsForTab() {
+        return ui.tab === 'pending' ? state.pending : ui.tab === 'history' ? state.history : state.positions;
+    }
+
+    function buildRow(order) {
+        var row = el('div', {'class': 'row'});
+        FIELDS.forEach(function () { row.appendChild(el('div')); });
+        row.appendChild(el('div', {}, '-'));
+        if (ui.tab === 'history') {
+            row.appendChild(el('div', {}, '-'));
+            row.appendChild(el('div', {}, '-'));
+        } else {
+            var edit = el('div'), close = el('div');
+            edit.appendChild(el('button', {'data-testid': 'asset-open-button-edit'}, '✎'));
+            close.appendChild(el('button', {'data-testid': 'asset-open-button-close'}, '✕'));
+            row.appendChild(edit);
+            row.appendChild(close);
+        }
+        row._orderId = order.order_id;
+        return row;
+    }
+
+    function renderTable() {
+        if (renderedTab !== ui.tab) {
+            tableEl.innerHTML = '';
+            rowsByOrder = {};
+            var header = el('div', {'class': 'row header'});
+            HEADERS.forEach(function (h) { header.appendChild(el('div', {}, h)); });
+            tableEl.appendChild(header);
+            renderedTab = ui.tab;
+        }
+        var orders = rowsForTab();
+        var seen = {};
+        var prev = tableEl.firstChild;
+        orders.forEach(function (order) {
+            seen[order.order_id] = true;
+            var row = rowsByOrder[order.order_id];
+            if (!row) {
+                row = buildRow(order);
+                rowsByOrder[order.order_id] = row;
+            }
+            if (prev.nextSibling !== row) tableEl.insertBefore(row, prev.nextSibling);
+            FIELDS.forEach(function (field, i) { setText(row.children[i], order[field]); });
+            prev = row;
+        });
+        Object.keys(rowsByOrder).forEach(function (id) {
+            if (!seen[id]) { rowsByOrder[id].remove(); delete rowsByOrder[id]; }
+        });
+    }
+
+    document.querySelector('nav.tabs').addEventListener('click', function (event) {
+        var tab = event.target.getAttribute('data-tab');
+        if (!tab) return;
+        ui.tab = tab;
+        Array.prototype.forEach.call(document.querySelectorAll('nav.tabs [data-tab]'), function (node) {
+            node.classList.toggle('active', node === event.target);
+        });
+        renderTable();
+    });
+
+    // ---------------- modals ----------------
+
+    function openModal(message, fields, buttons) {
+        var layer = el('section', {'class': 'modal-layer'});
+        var modal = el('section', {'class': 'modal'});
+        modal.appendChild(el('p', {}, message));
+        fields.forEach(function (f) {
+            modal.appendChild(el('label', {}, f.label));
+            var input = el('input', {'data-testid': f.testid});
+            input.value = f.value || '';
+            modal.appendChild(input);
+        });
+        buttons.forEach(function (b) {
+            var button = el('button', {}, b.text);
+            button.addEventListener('click', function () { layer.remove(); if (b.action) b.action(modal); });
+            modal.appendChild(button);
+        });
+        layer.appendChild(modal);
+        $('#modal-root').innerHTML = '';
+        $('#modal-root').appendChild(layer);
+    }
+
+    function closeOrder(orderId) {
+        api('POST', '/api/orders/' + orderId + '/close').then(function (res) {
+            if (!res.ok) { toast(res.data.error || 'Close failed', true); return; }
+            toast(ui.tab === 'pending' ? 'Order cancelled successfully' : 'Position closed successfully');
+            refresh();
+        });
+    }
+
+    tableEl.addEventListener('click', function (event) {
+        var button = event.target.closest('button');
+        if (!button) return;
+        var row = button.closest('.row');
+        var orderId = row && row._orderId;
+        var order = rowsForTab().filter(function (o) { return o.order_id === orderId; })[0];
+        if (!order) return;
+        if (button.getAttribute('data-testid') === 'asset-open-button-close') {
+            openModal('Close order ' + orderId + '?', [], [
+                {text: 'Confirm', action: function () { closeOrder(orderId); }},
+                {text: 'Cancel'}
+            ]);
+        } else if (button.getAttribute('data-testid') === 'asset-open-button-edit') {
+            openModal('Edit order ' + orderId, [
+                {label: 'Volume', testid: 'edit-volume-input', value: order.volume},
+                {label: 'Stop Loss', testid: 'edit-sl-input', value: order.sl === '-' ? '' : order.sl},
+                {label: 'Take Profit', testid: 'edit-tp-input', value: order.tp === '-' ? '' : order.tp}
+            ], [
+                {text: 'Update', action: function (modal) {
+                    api('POST', '/api/orders/' + orderId + '/edit', {
+                        volume: modal.querySelector('[data-testid="edit-volume-input"]').value,
+                        sl: modal.querySelector('[data-testid="edit-sl-input"]').value,
+                        tp: modal.querySelector('[data-testid="edit-tp-input"]').value
+                    }).then(function (res) {
+                        if (!res.ok) { toast(res.data.error || 'Update failed', true); return; }
+                        toast('Order updated successfully');
+                        refresh();
+                    });
+                }},
+                {text: 'Cancel'}
+            ]);
+        }
+    });
+
+    $('[data-testid="bulk-close"]').addEventListener('click', function () {
+        var kind = ui.tab === 'pending' ? 'pending' : 'positions';
+        openModal('Close all ' + (kind === 'pending' ? 'pending orders' : 'open positions') + '?', [], [
+            {text: 'Close All', action: function () {
+                api('POST', '/api/bulk-close', {kind: kind}).then(function (res) {
+                    toast(res.data.closed.length + ' orders closed successfully');
+                    refresh();
+                });
+            }},
+            {text: 'Cancel'}
+        ]);
+    });
+
+    // ---------------- notifications (virtualized list) ----------------
+
+    var panel = null, scroller = null, spacer = null, mounted = {};
+
+    function notificationLines(n) {
+        var lines = [n.date, 'Order No. ' + n.order_id + ' ' + n.symbol, n.type, 'Volume ' + n.volume];
+        if (n.profit) lines.push(n.profit);
+        lines.push('at', n.price);
+        return lines;
+    }
+
+    function buildItem(n) {
+        var item = el('div', {'data-testid': 'notification-list-result-item'});
+        item.appendChild(el('div', {'data-testid': 'notification-list-result-item-title'}, n.title));
+        notificationLines(n).forEach(function (line) { item.appendChild(el('div', {}, line)); });
+        return item;
+    }
+
+    function renderNotifications() {
+        if (!panel) return;
+        var list = state.notifications;
+        spacer.style.height = (list.length * ITEM_HEIGHT) + 'px';
+        var first = Math.max(0, Math.floor(scroller.scrollTop / ITEM_HEIGHT) - 1);
+        var last = Math.min(list.length, Math.ceil((scroller.scrollTop + scroller.clientHeight) / ITEM_HEIGHT) + 1);
+        var wanted = {};
+        for (var i = first; i < last; i++) {
+            var key = list[i].order_id + '|' + list[i].title + '|' + list[i].date;
+            wanted[key] = true;
+            var item = mounted[key];
+            if (!item) {
+                item = buildItem(list[i]);
+                mounted[key] = item;
+                spacer.appendChild(item);
+            }
+            item.style.top = (i * ITEM_HEIGHT) + 'px';
+        }
+        Object.keys(mounted).forEach(function (key) {
+            if (!wanted[key]) { mounted[key].remove(); delete mounted[key]; }
+        });
+    }
+
+    $('[data-testid="notification-selector"]').addEventListener('click', function () {
+        if (panel) {
+            panel.remove();
+            panel = scroller = spacer = null;
+            mounted = {};
+            return;
+        }
+        panel = el('section', {'class': 'notification-panel'});
+        scroller = el('div', {'data-testid': 'virtuoso-scroller'});
+        spacer = el('div', {'style': 'position: relative'});
+        scroller.appendChild(spacer);
+        panel.appendChild(scroller);
+        $('#notification-root').appendChild(panel);
+        scroller.addEventListener('scroll', renderNotifications);
+        renderNotifications();
+    });
+
+    // ---------------- prices + polling ----------------
+
+    function renderPrice() {
+        var q = state.quotes[ui.symbol];
+        if (!q) return;
+        setText($('#price-last'), q.last);
+        ui.prices.push(q.last);
+        if (ui.prices.length > 120) ui.prices.shift();
+        var canvas = $('#chart');
+        var ctx = canvas.getContext && canvas.getContext('2d');
+        if (!ctx || ui.prices.length < 2) return;
+        canvas.width = canvas.clientWidth;
+        canvas.height = canvas.clientHeight;
+        var min = Math.min.apply(null, ui.prices), max = Math.max.apply(null, ui.prices);
+        ctx.strokeStyle = '#f1c40f';
+        ctx.beginPath();
+        ui.prices.forEach(function (p, i) {
+            var x = i * canvas.width / (ui.prices.length - 1);
+            var y = canvas.height - ((p - min) / ((max - min) || 1)) * (canvas.height - 10) - 5;
+            if (i) ctx.lineTo(x, y); else ctx.moveTo(x, y);
+        });
+        ctx.stroke();
+    }
+
+    function refresh() {
+        return api('GET', '/api/state').then(function (res) {
+            if (!res.ok) return;
+            state = res.data;
+            setText($('#server-date'), state.server_date);
+            renderPrice();
+            renderTable();
+            renderNotifications();
+        });
+    }
+
+    setSide('BUY');
+    setExpiry('Good Till Day');
+    refresh();
+    setInterval(refresh, window.AQX_TICK_MS || 500);
+})();
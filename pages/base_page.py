@@ -3,22 +3,225 @@ BasePage - Base class for all Page Objects
 Base class containing common methods used in all Page Objects
 """
 
+import os
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from . import conditions as OC
+from .conditions import JS_LOCATE, ObserverWait
+
+
+# Production web app; set AQX_BASE_URL (e.g. to the local mock server) to switch
+DEFAULT_BASE_URL = "https://aqxtrader.aquariux.com"
+
+
+def get_base_url():
+    """Base URL of the AQX Trader web app (AQX_BASE_URL env var or production)"""
+    return os.getenv("AQX_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+# Resolves "settled" when the observed region had no structural mutation (element
+# added/removed) for quietMs, "condition" when the condition locator matches a
+# visible element, or "timeout". Text-only updates (live price ticks) are ignored.
+_JS_DOM_SETTLED = JS_LOCATE + """
+var region = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2], cond = arguments[3];
+var done = arguments[arguments.length - 1];
+var target = (region && __aqxLocate(region[0], region[1])[0]) || document.body;
+var finished = false, quietTimer = null, hardTimer = null, observer = null;
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    if (observer) observer.disconnect();
+    done(result);
+}
+function condMet() {
+    if (!cond) return false;
+    try { return __aqxLocate(cond[0], cond[1]).some(__aqxVisible); } catch (e) { return false; }
+}
+function armQuiet() {
+    if (cond) return;
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(function () { finish('settled'); }, quietMs);
+}
+if (condMet()) { finish('condition'); return; }
+observer = new MutationObserver(function (mutations) {
+    if (condMet()) { finish('condition'); return; }
+    var structural = mutations.some(function (m) {
+        return m.type === 'attributes' ||
+            Array.prototype.some.call(m.addedNodes, function (n) { return n.nodeType === 1; }) ||
+            Array.prototype.some.call(m.removedNodes, function (n) { return n.nodeType === 1; });
+    });
+    if (structural) armQuiet();
+});
+// attributeFilter is only allowed together with attributes: true
+var options = {childList: true, subtree: true};
+if (cond) { options.attributes = true; options.attributeFilter = ['style', 'class', 'hidden']; }
+observer.observe(target, options);
+armQuiet();
+hardTimer = setTimeout(function () { finish(condMet() ? 'condition' : 'timeout'); }, timeoutMs);
+"""
+
+# Element cache counters of all pages in this process (see BasePage.find)
+_cache_totals = {"hits": 0, "misses": 0, "stale": 0}
+
+
+def element_cache_stats():
+    """Element cache hits / misses / stale re-resolves of all pages in this process"""
+    return dict(_cache_totals)
+
+
+def print_element_cache_stats(stats):
+    """Print element cache counters (hits are find_element round-trips saved)"""
+    lookups = stats["hits"] + stats["misses"]
+    if not lookups:
+        return
+    print(f"🗃️  Element cache: {stats['hits']} hits / {stats['misses']} misses "
+          f"({stats['hits'] / lookups * 100:.0f}%), {stats['stale']} stale re-resolves")
 
 
 class BasePage:
     """
     Base class for all Page Object Models
     Contains common methods using WebDriverWait and expected conditions
+    
+    Common helpers wait push-based (ObserverWait + conditions module, aliased OC)
+    unless PUSH_WAITS is False, in which case they poll with WebDriverWait.
+    
+    Subclasses may list cheaper equivalents of their locators in FAST_LOCATORS
+    (attribute name -> locator); they replace the class locators on the instance
+    when AQX_FAST_LOCATORS=1 or fast_locators=True. See utils/locator_audit.py.
+    
+    find() / with_element() and the helpers built on them reuse WebElement
+    handles per locator until the handle goes stale or invalidate_elements()
+    is called (navigation, tab switch). CACHE_ELEMENTS = False disables it.
     """
     
-    def __init__(self, driver):
+    PUSH_WAITS = True
+    CACHE_ELEMENTS = True
+    FAST_LOCATORS = {}
+    
+    def __init__(self, driver, fast_locators=None):
         self.driver = driver
+        self._elements = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if fast_locators is None:
+            fast_locators = os.getenv("AQX_FAST_LOCATORS", "0") == "1"
+        self.fast_locators = fast_locators
+        if fast_locators:
+            for name, locator in self.FAST_LOCATORS.items():
+                setattr(self, name, locator)
         self.wait = WebDriverWait(driver, 10)
+        self.observer_wait = ObserverWait(driver, 10)
+    
+    def wait_until(self, condition, timeout=None, message=""):
+        """
+        Wait for an expected condition with the configured wait engine
+        
+        Args:
+            condition: Condition from pages.conditions (or any EC callable)
+            timeout: Maximum wait time (default 10s)
+            message: Message of the TimeoutException
+            
+        Returns:
+            Condition value (usually the WebElement)
+        """
+        if self.PUSH_WAITS:
+            waiter = self.observer_wait if timeout is None else ObserverWait(self.driver, timeout)
+        else:
+            waiter = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        return waiter.until(condition, message)
+    
+    def wait_for_any(self, conditions, timeout=None, message=""):
+        """
+        Wait for whichever of several outcomes happens first
+        
+        Args:
+            conditions: Dict {name: condition}, e.g. {"success": ..., "error": ...}
+            timeout: Maximum wait time (default 10s)
+            message: Message of the TimeoutException
+            
+        Returns:
+            tuple: (name, value) of the condition that fired first
+        
+        Raises:
+            TimeoutException: If none of the conditions is met in time
+        """
+        if self.PUSH_WAITS:
+            waiter = self.observer_wait if timeout is None else ObserverWait(self.driver, timeout)
+        else:
+            waiter = ObserverWait(self.driver, timeout or 10)
+            conditions = {name: c.fallback if isinstance(c, OC.JsCondition) else c
+                          for name, c in conditions.items()}
+        return waiter.until_any(conditions, message)
+    
+    def find(self, locator):
+        """
+        Find an element, reusing the cached handle for this locator
+        
+        Args:
+            locator: Tuple (By method, selector string)
+            
+        Returns:
+            WebElement (may be stale - use with_element() to re-resolve automatically)
+        """
+        key = tuple(locator)
+        if not self.CACHE_ELEMENTS:
+            return self.driver.find_element(*key)
+        element = self._elements.get(key)
+        if element is not None:
+            self.cache_hits += 1
+            _cache_totals["hits"] += 1
+            return element
+        self.cache_misses += 1
+        _cache_totals["misses"] += 1
+        element = self.driver.find_element(*key)
+        self._elements[key] = element
+        return element
+    
+    def with_element(self, locator, action):
+        """
+        Run action(element) on the cached element, re-resolving it once if stale
+        
+        Args:
+            locator: Tuple (By method, selector string)
+            action: Callable taking the WebElement
+            
+        Returns:
+            Result of action
+        """
+        try:
+            return action(self.find(locator))
+        except StaleElementReferenceException:
+            if self.CACHE_ELEMENTS:
+                _cache_totals["stale"] += 1
+            self._elements.pop(tuple(locator), None)
+            return action(self.find(locator))
+    
+    def invalidate_elements(self):
+        """Drop all cached element handles (after navigation or a tab switch)"""
+        self._elements.clear()
+    
+    def click_element(self, locator):
+        """Click an element without waiting (cached handle)"""
+        self.with_element(locator, lambda el: el.click())
+    
+    def fill_field(self, locator, text):
+        """Clear an input and type text into it (cached handle)"""
+        def fill(el):
+            el.clear()
+            el.send_keys(text)
+        self.with_element(locator, fill)
+    
+    def element_text(self, locator):
+        """Stripped text of an element (cached handle)"""
+        return self.with_element(locator, lambda el: el.text.strip())
     
     def click(self, locator):
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        self.wait_until(OC.element_to_be_clickable(locator)).click()
     
     def type(self, locator, text):
         """
@@ -28,7 +231,7 @@ class BasePage:
             locator: Tuple (By method, selector string)
             text: Text to input
         """
-        element = self.wait.until(EC.visibility_of_element_located(locator))
+        element = self.wait_until(OC.visibility_of_element_located(locator))
         element.clear()
         element.send_keys(text)
     
@@ -42,7 +245,7 @@ class BasePage:
         Returns:
             str: Text content
         """
-        return self.wait.until(EC.visibility_of_element_located(locator)).text
+        return self.wait_until(OC.visibility_of_element_located(locator)).text
     
     def wait_until_disappear(self, locator):
         """
@@ -51,7 +254,7 @@ class BasePage:
         Args:
             locator: Tuple (By method, selector string)
         """
-        self.wait.until(EC.invisibility_of_element_located(locator))
+        self.wait_until(OC.invisibility_of_element_located(locator))
     
     def is_element_visible(self, locator, timeout=5):
         """
@@ -65,9 +268,7 @@ class BasePage:
             bool: True if visible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.wait_until(OC.visibility_of_element_located(locator), timeout=timeout)
             return True
         except:
             return False
@@ -84,9 +285,64 @@ class BasePage:
             bool: True if present, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self.wait_until(OC.presence_of_element_located(locator), timeout=timeout)
             return True
         except:
             return False
+    
+    def run_async_script(self, script, *args, timeout):
+        """
+        Run an in-page async script that resolves itself within `timeout` seconds
+        
+        The driver's script timeout is not set per call (and so never leaks to
+        the next test on a pooled driver): conditions.ensure_script_timeout()
+        only raises it, once, when it would not cover the wait.
+        
+        Args:
+            script: Async script (calls the callback passed as its last argument)
+            *args: Script arguments
+            timeout: Longest time the script may take to call back
+            
+        Returns:
+            Value the script passed to its callback
+        """
+        OC.ensure_script_timeout(self.driver, timeout + 2)
+        return self.driver.execute_async_script(script, *args)
+    
+    def wait_for_dom_settled(self, region=None, quiet=0.3, timeout=5, condition=None):
+        """
+        Wait until a region's DOM stops mutating, or until a condition holds
+        
+        Uses an in-page MutationObserver (one WebDriver round-trip) instead of
+        fixed sleeps. Text-only updates such as live price ticks do not reset
+        the quiet window.
+        
+        Args:
+            region: Locator of the element to observe (default: whole document)
+            quiet: Seconds without structural DOM changes to consider it settled
+            timeout: Maximum wait time in seconds
+            condition: Optional locator - return as soon as it matches a visible
+                       element (the quiet window is then not used)
+            
+        Returns:
+            bool: True if settled or condition met, False on timeout or script error
+                  (after a script error the quiet window is slept instead)
+        """
+        try:
+            result = self.run_async_script(
+                _JS_DOM_SETTLED,
+                list(region) if region else None,
+                int(quiet * 1000),
+                int(timeout * 1000),
+                list(condition) if condition else None,
+                timeout=timeout,
+            )
+        except Exception as e:
+            print(f"[!] wait_for_dom_settled failed: {e}")
+            time.sleep(quiet)
+            return False
+        if result == "timeout":
+            what = f"{condition[1]} not visible" if condition else "DOM still changing"
+            print(f"[!] wait_for_dom_settled: {what} after {timeout}s")
+            return False
+        return True
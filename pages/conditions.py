@@ -0,0 +1,281 @@
+"""
+Conditions - Push-based expected conditions resolved by in-page MutationObservers
+Drop-in counterparts of selenium's expected_conditions: each condition is still a
+normal callable usable with WebDriverWait, but ObserverWait resolves it inside the
+page in a single execute_async_script round-trip as soon as the DOM satisfies it.
+"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# WebDriver cap for in-page async scripts. Every script here resolves itself
+# on its own timeout, so the cap is only raised (never restored) per driver.
+SCRIPT_TIMEOUT = 60
+
+
+def ensure_script_timeout(driver, timeout=0):
+    """
+    Make sure the driver's async script timeout covers `timeout` seconds
+
+    The value set is remembered on the driver, so only the first call (or one
+    needing more than SCRIPT_TIMEOUT) costs a WebDriver round-trip.
+
+    Args:
+        driver: WebDriver instance
+        timeout: Longest wait the next script may take
+    """
+    current = getattr(driver, "_aqx_script_timeout", None)
+    if current is None or current < timeout:
+        value = max(timeout, SCRIPT_TIMEOUT)
+        driver.set_script_timeout(value)
+        driver._aqx_script_timeout = value
+
+
+# In-page helper: resolve a Selenium (By, selector) locator to an array of elements
+JS_LOCATE = """
+function __aqxLocate(by, sel, root) {
+    root = root || document;
+    if (by === 'xpath') {
+        var snap = document.evaluate(sel, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var out = [];
+        for (var i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+        return out;
+    }
+    if (by === 'css selector') return Array.prototype.slice.call(root.querySelectorAll(sel));
+    if (by === 'id') return Array.prototype.slice.call(root.querySelectorAll('[id="' + sel + '"]'));
+    if (by === 'name') return Array.prototype.slice.call(root.querySelectorAll('[name="' + sel + '"]'));
+    if (by === 'class name') return Array.prototype.slice.call(root.getElementsByClassName(sel));
+    if (by === 'tag name') return Array.prototype.slice.call(root.getElementsByTagName(sel));
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function __aqxVisible(el) {
+    return !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+}
+"""
+
+# In-page evaluation of one condition spec {kind, by, sel, text}; returns the
+# condition value (element, list or true) or null when not (yet) satisfied
+JS_CHECK = JS_LOCATE + """
+function __aqxCheck(spec) {
+    var els;
+    try { els = __aqxLocate(spec.by, spec.sel); } catch (e) { return null; }
+    var visible = els.filter(__aqxVisible);
+    switch (spec.kind) {
+        case 'presence': return els[0] || null;
+        case 'all_present': return els.length ? els : null;
+        case 'visible': return visible[0] || null;
+        case 'any_visible': return visible.length ? visible : null;
+        case 'clickable':
+            for (var i = 0; i < visible.length; i++) if (!visible[i].disabled) return visible[i];
+            return null;
+        case 'invisible': return visible.length ? null : true;
+        case 'text':
+            return (els[0] && (els[0].innerText || els[0].textContent || '').indexOf(spec.text) >= 0) ? true : null;
+    }
+    return null;
+}
+"""
+
+_JS_OBSERVE_UNTIL = JS_CHECK + """
+var spec = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var finished = false, observer = null, timer = null;
+function finish(res) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(res);
+}
+function check() {
+    var value = __aqxCheck(spec);
+    if (value !== null) finish({ok: true, value: value});
+}
+check();
+if (finished) return;
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+timer = setTimeout(function () { finish({ok: false}); }, timeoutMs);
+"""
+
+# Race several named condition specs; resolves with the first one satisfied
+_JS_OBSERVE_ANY = JS_CHECK + """
+var specs = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var names = Object.keys(specs);
+var finished = false, observer = null, timer = null;
+function finish(res) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(res);
+}
+function check() {
+    for (var i = 0; i < names.length; i++) {
+        var value = __aqxCheck(specs[names[i]]);
+        if (value !== null) { finish({ok: true, name: names[i], value: value}); return; }
+    }
+}
+check();
+if (finished) return;
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+timer = setTimeout(function () { finish({ok: false}); }, timeoutMs);
+"""
+
+
+class JsCondition:
+    """
+    Expected condition with an in-page (JavaScript) equivalent
+
+    Calling it behaves exactly like the selenium condition it wraps, so it can
+    be passed to WebDriverWait as well as to ObserverWait.
+    """
+
+    def __init__(self, kind, locator, fallback, text=None):
+        self.kind = kind
+        self.locator = locator
+        self.fallback = fallback
+        self.text = text
+
+    def __call__(self, driver):
+        return self.fallback(driver)
+
+    def spec(self):
+        """Serializable description passed to the in-page checker"""
+        return {"kind": self.kind, "by": self.locator[0], "sel": self.locator[1], "text": self.text}
+
+    def __repr__(self):
+        return f"{self.kind}{tuple(self.locator)}"
+
+
+def presence_of_element_located(locator):
+    return JsCondition("presence", locator, EC.presence_of_element_located(locator))
+
+
+def presence_of_all_elements_located(locator):
+    return JsCondition("all_present", locator, EC.presence_of_all_elements_located(locator))
+
+
+def visibility_of_element_located(locator):
+    return JsCondition("visible", locator, EC.visibility_of_element_located(locator))
+
+
+def visibility_of_any_elements_located(locator):
+    return JsCondition("any_visible", locator, EC.visibility_of_any_elements_located(locator))
+
+
+def element_to_be_clickable(locator):
+    return JsCondition("clickable", locator, EC.element_to_be_clickable(locator))
+
+
+def invisibility_of_element_located(locator):
+    return JsCondition("invisible", locator, EC.invisibility_of_element_located(locator))
+
+
+def text_to_be_present_in_element(locator, text_):
+    return JsCondition("text", locator, EC.text_to_be_present_in_element(locator, text_), text=text_)
+
+
+class ObserverWait:
+    """
+    Push-based replacement for WebDriverWait
+
+    until() accepts the same conditions as WebDriverWait.until(). Conditions
+    from this module resolve in one round-trip as soon as a MutationObserver
+    sees them satisfied; any other callable falls back to regular polling.
+    """
+
+    def __init__(self, driver, timeout=10):
+        self._driver = driver
+        self._timeout = timeout
+
+    def _run_script(self, script, *args):
+        """
+        Run an observer script - one execute_async_script round-trip per wait
+
+        A script timeout is raised as TimeoutException; other WebDriverExceptions
+        (page navigated, script blocked) are left to the caller's polling fallback.
+        """
+        ensure_script_timeout(self._driver, self._timeout + 2)
+        return self._driver.execute_async_script(script, *args, int(self._timeout * 1000))
+
+    def _poll(self, started, method, message):
+        """Polling fallback for the rest of the timeout only"""
+        remaining = max(self._timeout - (time.monotonic() - started), 0)
+        return WebDriverWait(self._driver, remaining).until(method, message)
+
+    def until(self, method, message=""):
+        """
+        Wait until the condition is met
+
+        Args:
+            method: Condition (JsCondition or any WebDriverWait-compatible callable)
+            message: Message of the TimeoutException
+
+        Returns:
+            Condition value (WebElement, list of WebElements or True)
+        """
+        if not isinstance(method, JsCondition):
+            return WebDriverWait(self._driver, self._timeout).until(method, message)
+
+        started = time.monotonic()
+        try:
+            res = self._run_script(_JS_OBSERVE_UNTIL, method.spec())
+        except TimeoutException:
+            raise TimeoutException(message or f"{method!r} not met after {self._timeout}s")
+        except WebDriverException:
+            # Page navigated or script blocked mid-wait - poll for the time left
+            return self._poll(started, method, message)
+
+        if res and res.get("ok"):
+            return res["value"]
+        raise TimeoutException(message or f"{method!r} not met after {self._timeout}s")
+
+    def until_any(self, conditions, message=""):
+        """
+        Wait until the first of several named conditions is met
+
+        Args:
+            conditions: Dict {name: condition}; on a tie the first listed wins
+            message: Message of the TimeoutException
+
+        Returns:
+            tuple: (name, value) of the condition that fired first
+        """
+        started = time.monotonic()
+        timeout_message = message or f"None of {list(conditions)} met after {self._timeout}s"
+        if all(isinstance(c, JsCondition) for c in conditions.values()):
+            try:
+                res = self._run_script(_JS_OBSERVE_ANY, {name: c.spec() for name, c in conditions.items()})
+            except TimeoutException:
+                raise TimeoutException(timeout_message)
+            except WebDriverException:
+                res = None  # Page navigated mid-wait - poll for the time left
+            else:
+                if res and res.get("ok"):
+                    return res["name"], res["value"]
+                raise TimeoutException(timeout_message)
+
+        return self._poll(started, lambda driver: _first_met(driver, conditions), message)
+
+
+def _first_met(driver, conditions):
+    """Polling fallback for until_any(): (name, value) of the first met condition"""
+    for name, condition in conditions.items():
+        try:
+            value = condition(driver)
+        except WebDriverException:
+            continue
+        if value:
+            return name, value
+    return False
@@ -4,10 +4,9 @@ Handles all interactions with AQX Trader login page
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from .base_page import BasePage
-import time
+from selenium.common.exceptions import TimeoutException
+from . import conditions as OC
+from .base_page import BasePage, get_base_url
 
 class LoginPagePOM(BasePage):
     
@@ -22,14 +21,20 @@ class LoginPagePOM(BasePage):
     LOGIN_FORM = (By.XPATH, "//div[normalize-space(text())='Log in']")
     PAGE_TITLE_BEGIN = (By.XPATH, "//span[contains(.,'AQX Announcement: Welcome to AQX Trader!')]")
     POPUP_ERROR_TEXT_CREDENTIALS = (By.XPATH, "//div[contains(text(), 'Invalid credentials')]")
+    
+    # Equivalent CSS locators (opt in with AQX_FAST_LOCATORS=1)
+    FAST_LOCATORS = {
+        'LOGIN_BUTTON': (By.CSS_SELECTOR, "button[data-testid='login-submit']"),
+    }
 
     # ============================================
     # 2️⃣ INITIALIZATION (__init__)
     # ============================================
 
-    def __init__(self, driver):
-        super().__init__(driver) 
-        self.url = "https://aqxtrader.aquariux.com"
+    def __init__(self, driver, base_url=None, fast_locators=None):
+        super().__init__(driver, fast_locators) 
+        self.base_url = base_url or get_base_url()
+        self.url = self.base_url
     
     # ============================================
     # 3️⃣ METHODS (Actions)
@@ -38,14 +43,17 @@ class LoginPagePOM(BasePage):
     def open_page(self):
         """Open login page"""
         self.driver.get(self.url)
-        self.wait.until(EC.visibility_of_element_located(self.LOGIN_FORM))
+        self.invalidate_elements()
+        self.wait_until(OC.visibility_of_element_located(self.LOGIN_FORM))
         print(f"[✓] Opened login page: {self.url}")
         return self
     
-    def goto_page(self, url="https://aqxtrader.aquariux.com/web/login"):
+    def goto_page(self, url=None):
         """Navigate to specific URL with login page path"""
+        url = url or f"{self.base_url}/web/login"
         self.driver.get(url)
-        self.wait.until(EC.visibility_of_element_located(self.LOGIN_FORM))
+        self.invalidate_elements()
+        self.wait_until(OC.visibility_of_element_located(self.LOGIN_FORM))
         print(f"[✓] Navigated to: {url}")
         return self
     
@@ -65,21 +73,38 @@ class LoginPagePOM(BasePage):
         """Click login button"""
         self.click(self.LOGIN_BUTTON)
         print("[✓] Clicked login button")
-        time.sleep(2)
         return self
     
+    def wait_for_login_outcome(self, timeout=10):
+        """
+        Race login success against the invalid-credentials popup
+        
+        Args:
+            timeout: Maximum wait time
+            
+        Returns:
+            tuple: ("success" | "error", WebElement), or (None, None) on timeout
+        """
+        try:
+            return self.wait_for_any({
+                "success": OC.visibility_of_element_located(self.PAGE_TITLE_BEGIN),
+                "error": OC.visibility_of_element_located(self.POPUP_ERROR_TEXT_CREDENTIALS),
+            }, timeout=timeout)
+        except TimeoutException:
+            return None, None
+    
     def get_error_message_with_popup(self, timeout=10):
         """Get error message text from popup if displayed"""
-        try:
-            error = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self.POPUP_ERROR_TEXT_CREDENTIALS)
-            )
-            error_text = error.text
+        outcome, element = self.wait_for_login_outcome(timeout)
+        if outcome == "error":
+            error_text = element.text
             print(f"[!] Popup error message: {error_text}")
             return error_text
-        except Exception as e:
-            print(f"[!] Popup error message not found: {str(e)}")
-            return None
+        if outcome == "success":
+            print("[!] Popup error message not found: login succeeded")
+        else:
+            print(f"[!] Popup error message not found: timeout after {timeout}s")
+        return None
     
     def login(self, username, password):
         """Complete login process with username and password"""
@@ -91,9 +116,9 @@ class LoginPagePOM(BasePage):
     def verify_page_loaded(self):
         """Verify login page is loaded correctly"""
         try:
-            self.wait.until(EC.visibility_of_element_located(self.LOGIN_FORM))
-            self.wait.until(EC.visibility_of_element_located(self.USERNAME_FIELD))
-            self.wait.until(EC.visibility_of_element_located(self.PASSWORD_FIELD))
+            self.wait_until(OC.visibility_of_element_located(self.LOGIN_FORM))
+            self.wait_until(OC.visibility_of_element_located(self.USERNAME_FIELD))
+            self.wait_until(OC.visibility_of_element_located(self.PASSWORD_FIELD))
             print("[✓] Login page loaded correctly")
             return True
         except Exception as e:
@@ -101,17 +126,15 @@ class LoginPagePOM(BasePage):
             return False
     
     def wait_for_success(self, timeout=10):
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            page_title = wait.until(
-                EC.visibility_of_element_located(self.PAGE_TITLE_BEGIN)
-            )
-            print(f"[✓] Login successful - PAGE_TITLE_BEGIN found: {page_title.text}")
+        outcome, element = self.wait_for_login_outcome(timeout)
+        if outcome == "success":
+            print(f"[✓] Login successful - PAGE_TITLE_BEGIN found: {element.text}")
             return True
-        except Exception as e:
+        if outcome == "error":
+            print(f"[✗] Login failed - popup: {element.text}")
+        else:
             print(f"[✗] Login failed or timeout - PAGE_TITLE_BEGIN not found")
-            print(f"    Error: {str(e)}")
-            return False
+        return False
     
     def get_current_url(self):
         """Get current page URL"""
@@ -120,6 +143,7 @@ class LoginPagePOM(BasePage):
     def refresh_page(self):
         """Refresh the page"""
         self.driver.refresh()
+        self.invalidate_elements()
         self.verify_page_loaded()
         print("[✓] Page refreshed")
         return self
@@ -0,0 +1,176 @@
+"""
+notification_parser - Compiled parser for notification panel entries
+Classifies each line of a notification in a single pass with precompiled
+patterns. parse_many() parses a whole scraped panel at once and
+parse_mhtml() reads the entries out of a saved (MHTML) page.
+"""
+
+import email
+import re
+from email import policy
+from html.parser import HTMLParser
+
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+ORDER_NO_RE = re.compile(r'Order No\.\s*(\d+)')
+SYMBOL_RE = re.compile(r'\b([A-Z]{6})\b')
+DECIMAL_RE = re.compile(r'(\d+\.\d+)')
+PROFIT_RE = re.compile(r'[+-]?\d+\.\d+')
+
+SIDES = frozenset(('BUY', 'SELL'))
+FIELDS = ('date', 'order_id', 'symbol', 'type', 'volume', 'profit', 'title')
+
+ITEM_TESTID = 'notification-list-result-item'
+TITLE_TESTID = 'notification-list-result-item-title'
+
+
+def parse(text, title=None):
+    """
+    Parse one notification's text
+
+    Args:
+        text: innerText of a notification item (one field per line)
+        title: Optional notification title
+
+    Returns:
+        dict: {date, order_id, symbol, type, volume, profit, title} (strings or None)
+    """
+    data = dict.fromkeys(FIELDS)
+    data['title'] = title
+    seen_at = False
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        lower = line.lower()
+        if lower == 'at':
+            seen_at = True
+        elif DATE_RE.match(line):
+            data['date'] = line.split()[0]
+        elif 'Order No.' in line:
+            if match := ORDER_NO_RE.search(line):
+                data['order_id'] = match.group(1)
+            if match := SYMBOL_RE.search(line):
+                data['symbol'] = match.group(1)
+        elif line in SIDES:
+            data['type'] = line
+        elif 'volume' in lower:
+            if match := DECIMAL_RE.search(line):
+                data['volume'] = match.group(1)
+        elif not seen_at and not data['profit'] and PROFIT_RE.fullmatch(line):
+            data['profit'] = line
+    return data
+
+
+def parse_many(texts):
+    """
+    Parse a batch of notifications
+
+    Args:
+        texts: Iterable of notification texts or (text, title) pairs
+
+    Returns:
+        list: Parsed dicts, in input order
+    """
+    results = []
+    append = results.append
+    for entry in texts:
+        if isinstance(entry, str):
+            append(parse(entry))
+        else:
+            append(parse(*entry))
+    return results
+
+
+class _NotificationHTMLParser(HTMLParser):
+    """Collects (text, title) for every notification item in an HTML page"""
+
+    BLOCK_TAGS = frozenset(('div', 'p', 'li', 'section', 'br', 'tr'))
+    # Elements without an end tag; they must not open a nesting level
+    VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'source', 'track', 'wbr'))
+
+    def __init__(self):
+        super().__init__()
+        self.items = []
+        self._depth = 0
+        self._title_depth = None
+        self._lines = []
+        self._current = []
+        self._title = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            self.handle_startendtag(tag, attrs)
+        elif self._depth:
+            self._depth += 1
+            self._break_line(tag)
+            if dict(attrs).get('data-testid') == TITLE_TESTID:
+                self._title_depth = self._depth
+        elif dict(attrs).get('data-testid') == ITEM_TESTID:
+            self._depth = 1
+
+    def handle_startendtag(self, tag, attrs):
+        # Void and self-closing (<x/>) elements never get an end tag
+        if self._depth:
+            self._break_line(tag)
+
+    def handle_endtag(self, tag):
+        if not self._depth or tag in self.VOID_TAGS:
+            return
+        self._break_line(tag)
+        if self._title_depth == self._depth:
+            self._title_depth = None
+        self._depth -= 1
+        if not self._depth:
+            text = '\n'.join(self._lines)
+            title = ' '.join(''.join(self._title).split()) or None
+            if text:
+                self.items.append((text, title))
+            self._lines, self._title = [], []
+
+    def handle_data(self, data):
+        if self._depth:
+            self._current.append(data)
+            if self._title_depth is not None:
+                self._title.append(data)
+
+    def _break_line(self, tag):
+        if tag in self.BLOCK_TAGS and self._current:
+            line = ' '.join(''.join(self._current).split())
+            if line:
+                self._lines.append(line)
+            self._current = []
+
+
+def texts_from_html(html):
+    """(text, title) pairs for every notification item in an HTML document"""
+    parser = _NotificationHTMLParser()
+    parser.feed(html)
+    parser.close()
+    return parser.items
+
+
+def parse_mhtml(source):
+    """
+    Parse every notification in a saved MHTML page (Chrome "Save as single file")
+
+    Args:
+        source: Path to the .mhtml file, or its contents as str/bytes
+
+    Returns:
+        list: Parsed dicts, in page order
+    """
+    if isinstance(source, str) and not source.lstrip().startswith(('From:', 'MIME-Version', 'Content-')):
+        with open(source, 'rb') as f:
+            source = f.read()
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+
+    message = email.message_from_bytes(source, policy=policy.default)
+    pairs = []
+    for part in message.walk():
+        if part.get_content_type() == 'text/html':
+            pairs.extend(texts_from_html(part.get_content()))
+    return parse_many(pairs)
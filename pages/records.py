@@ -0,0 +1,223 @@
+"""
+records - Compact typed records for positions and notifications
+Slotted Position/Notification types with parsed fields (int order ID,
+Decimal prices and volumes, datetime dates) built once from scraped text,
+plus RecordColumns, a column-oriented container for large snapshots, and
+the OrderSnapshot / OrderDiff pair used to find the rows an action changed.
+Records keep dict-style get()/[] access for existing callers.
+"""
+
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+
+EMPTY_CELLS = frozenset(('', '-', '--'))
+DATE_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d')
+
+
+def to_text(value):
+    """Stripped string, or None for blank/placeholder cells"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value in EMPTY_CELLS else value
+
+
+def to_upper(value):
+    value = to_text(value)
+    return value.upper() if value else value
+
+
+def to_int(value):
+    if value is None or isinstance(value, int):
+        return value
+    value = to_text(value)
+    return int(value) if value and value.isdigit() else None
+
+
+def to_decimal(value):
+    if value is None or isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    value = to_text(value)
+    if not value:
+        return None
+    try:
+        return Decimal(value.replace(',', '').replace('+', ''))
+    except InvalidOperation:
+        return None
+
+
+def to_datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    value = to_text(value)
+    if not value:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+class Record:
+    """Base for slotted records; subclasses list their fields in __slots__"""
+
+    __slots__ = ()
+    CONVERTERS = {}
+
+    def __init__(self, **values):
+        for field in self.__slots__:
+            setattr(self, field, values.get(field))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from scraped (string) or already typed values"""
+        convert = cls.CONVERTERS
+        return cls(**{field: convert.get(field, to_text)(data.get(field))
+                      for field in cls.__slots__})
+
+    @property
+    def match_key(self):
+        """(symbol, type, volume) key used to match positions and notifications"""
+        return self.symbol, self.type, self.volume
+
+    def matches(self, **expected):
+        """
+        True if every given field equals the expected value (None = any)
+
+        Expected values are converted like scraped ones, so "buy" matches
+        type BUY and 0.5 matches volume Decimal("0.50").
+        """
+        convert = self.CONVERTERS
+        for field, value in expected.items():
+            if value is not None and getattr(self, field) != convert.get(field, to_text)(value):
+                return False
+        return True
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items() if v is not None)
+        return f"{type(self).__name__}({fields})"
+
+
+class Position(Record):
+    """One row of the positions / pending orders table"""
+
+    __slots__ = ('open_date', 'order_id', 'symbol', 'type', 'profit', 'volume', 'units',
+                 'entry_price', 'current_price', 'take_profit', 'stop_loss', 'swap', 'title')
+    CONVERTERS = {
+        'open_date': to_datetime,
+        'order_id': to_int,
+        'symbol': to_upper,
+        'type': to_upper,
+        'profit': to_decimal,
+        'volume': to_decimal,
+        'units': to_decimal,
+        'entry_price': to_decimal,
+        'current_price': to_decimal,
+        'take_profit': to_decimal,
+        'stop_loss': to_decimal,
+        'swap': to_decimal,
+    }
+
+
+class Notification(Record):
+    """One entry of the notification panel"""
+
+    __slots__ = ('date', 'order_id', 'symbol', 'type', 'volume', 'profit', 'title')
+    CONVERTERS = {
+        'date': to_datetime,
+        'order_id': to_int,
+        'symbol': to_upper,
+        'type': to_upper,
+        'volume': to_decimal,
+        'profit': to_decimal,
+    }
+
+
+class RecordColumns:
+    """
+    Column-oriented container for large sets of one record type
+
+    Stores one list per field instead of one object per row; rows are
+    materialized as records only when iterated or indexed.
+    """
+
+    def __init__(self, record_type, records=()):
+        self.record_type = record_type
+        self.columns = {field: [] for field in record_type.__slots__}
+        for record in records:
+            self.append(record)
+
+    def append(self, record):
+        if isinstance(record, dict):
+            record = self.record_type.from_dict(record)
+        for field, column in self.columns.items():
+            column.append(getattr(record, field))
+
+    def column(self, field):
+        """All values of one field, in row order"""
+        return self.columns[field]
+
+    def __len__(self):
+        return len(self.columns[self.record_type.__slots__[0]])
+
+    def __getitem__(self, idx):
+        return self.record_type(**{field: column[idx] for field, column in self.columns.items()})
+
+    def __iter__(self):
+        fields = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield self.record_type(**dict(zip(fields, values)))
+
+
+class OrderSnapshot:
+    """Rows of the order tables before an action: {tab: {order_id: Position}}"""
+
+    __slots__ = ('tabs',)
+
+    def __init__(self, tabs=None):
+        self.tabs = tabs if tabs is not None else {}
+
+    def order_ids(self, tab):
+        return set(self.tabs.get(tab, ()))
+
+
+class OrderDiff:
+    """Rows added to / removed from one order table since an OrderSnapshot"""
+
+    __slots__ = ('tab', 'added', 'removed')
+
+    def __init__(self, tab, added, removed):
+        self.tab = tab
+        self.added = added
+        self.removed = removed
+
+    def __bool__(self):
+        return bool(self.added or self.removed)
+
+    @property
+    def order_ids(self):
+        """Order IDs of the added rows"""
+        return [position.order_id for position in self.added]
+
+    def __repr__(self):
+        return f"OrderDiff(tab={self.tab!r}, added={self.order_ids}, " \
+               f"removed={[p.order_id for p in self.removed]})"
@@ -4,21 +4,377 @@ Handles all interactions with the trading chart and order placement
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from . import conditions as OC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.keys import Keys
-from .base_page import BasePage
+from .base_page import BasePage, get_base_url
+from .conditions import JS_LOCATE
+from . import notification_parser
+from .records import Notification, OrderDiff, OrderSnapshot, Position, RecordColumns
+import os
 import time
 import re
 
 
+# Shared helpers for the single round-trip ticket scripts below. Values are set
+# through the native setter so React's value tracker sees the change, and waits
+# are MutationObserver promises that resolve to null on timeout.
+_JS_HELPERS = JS_LOCATE + """
+function __aqxFirst(loc) {
+    try { return __aqxLocate(loc[0], loc[1]).filter(__aqxVisible)[0] || null; } catch (e) { return null; }
+}
+function __aqxText(loc) {
+    var el = __aqxFirst(loc);
+    return el ? (el.innerText || el.textContent || '').trim() : null;
+}
+function __aqxSetValue(input, value) {
+    var proto = input instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    input.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+function __aqxWaitFor(check, timeoutMs) {
+    return new Promise(function (resolve) {
+        var found = check();
+        if (found) { resolve(found); return; }
+        var observer = new MutationObserver(function () {
+            var found = check();
+            if (found) { observer.disconnect(); clearTimeout(timer); resolve(found); }
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true, attributes: true});
+        var timer = setTimeout(function () { observer.disconnect(); resolve(null); }, timeoutMs);
+    });
+}
+function __aqxPickSymbol(locs, symbol, timeoutMs) {
+    var input = __aqxFirst(locs.input);
+    if (!input) return Promise.resolve({error: 'symbol input not found'});
+    __aqxSetValue(input, symbol);
+    return __aqxWaitFor(function () { return __aqxFirst(locs.result); }, timeoutMs).then(function (result) {
+        if (!result) return {error: 'no dropdown result'};
+        result.click();
+        return __aqxWaitFor(function () {
+            var title = __aqxText(locs.title);
+            return title !== null && title.toUpperCase().indexOf(symbol.toUpperCase()) >= 0 ? title : null;
+        }, timeoutMs).then(function (title) {
+            return {title: title || __aqxText(locs.title), price: __aqxText(locs.price)};
+        });
+    });
+}
+"""
+
+# Fast symbol entry in one round-trip: set the value, wait for the dropdown
+# result, select it, wait for the overview title and read the price.
+_JS_FAST_SYMBOL = _JS_HELPERS + """
+var done = arguments[arguments.length - 1];
+__aqxPickSymbol(arguments[0], arguments[1], arguments[2]).then(done, function (e) { done({error: String(e)}); });
+"""
+
+# Whole order ticket fill in one round-trip. Steps run in order and each one
+# records itself in `applied` or `failed`; validation messages are collected
+# from the error toast locator and from invalid ticket inputs at the end.
+_JS_FILL_TICKET = _JS_HELPERS + """
+var locs = arguments[0], plan = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var result = {applied: [], failed: {}, messages: [], title: null, price: null};
+
+function waitVisible(loc) {
+    return __aqxWaitFor(function () { return __aqxFirst(loc); }, timeoutMs);
+}
+function pick(field, dropdownLoc, optionLoc) {
+    var dropdown = __aqxFirst(dropdownLoc);
+    if (!dropdown) { result.failed[field] = 'dropdown not found'; return Promise.resolve(); }
+    dropdown.click();
+    return waitVisible(optionLoc).then(function (option) {
+        if (!option) { result.failed[field] = 'option not found'; return; }
+        option.click();
+        result.applied.push(field);
+    });
+}
+function fill(field, loc, value) {
+    var input = __aqxFirst(loc);
+    if (!input) { result.failed[field] = 'input not found'; return; }
+    __aqxSetValue(input, value);
+    input.dispatchEvent(new Event('blur'));
+    result.applied.push(field);
+}
+function fillPicker(field, loc, value) {
+    return waitVisible(loc).then(function (box) {
+        if (!box) { result.failed[field] = 'input not found'; return; }
+        box.click();
+        var input = document.activeElement;
+        if (!input || input.tagName !== 'INPUT') {
+            var container = box.closest('[data-testid]') || box.parentElement;
+            input = container && container.querySelector('input');
+        }
+        if (!input) { result.failed[field] = 'input not found'; return; }
+        __aqxSetValue(input, value);
+        input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, bubbles: true}));
+        result.applied.push(field);
+    });
+}
+function collectMessages() {
+    var seen = {};
+    function add(message) {
+        message = (message || '').trim();
+        if (message && !seen[message]) { seen[message] = true; result.messages.push(message); }
+    }
+    try { __aqxLocate(locs.error[0], locs.error[1]).filter(__aqxVisible).forEach(function (el) { add(el.innerText); }); } catch (e) {}
+    [locs.volume, locs.sl, locs.tp].forEach(function (loc) {
+        var input = __aqxFirst(loc);
+        if (!input) return;
+        if (input.validationMessage) add(input.validationMessage);
+        if (input.getAttribute('aria-invalid') === 'true') add(input.name + ' is invalid');
+    });
+}
+
+async function run() {
+    if (plan.side) {
+        var side = __aqxFirst(plan.side === 'buy' ? locs.buy : locs.sell);
+        if (side) { side.click(); result.applied.push('side'); } else { result.failed.side = 'button not found'; }
+    }
+    if (plan.symbol) {
+        var picked = await __aqxPickSymbol(locs.symbol, plan.symbol, timeoutMs);
+        if (picked.error) { result.failed.symbol = picked.error; }
+        else { result.applied.push('symbol'); result.title = picked.title; result.price = picked.price; }
+    }
+    if (plan.order_type) await pick('order_type', locs.order_type, locs.order_type_option);
+    if (plan.volume !== null) fill('volume', locs.volume, plan.volume);
+    if (plan.sl !== null) fill('sl', locs.sl, plan.sl);
+    if (plan.tp !== null) fill('tp', locs.tp, plan.tp);
+    if (plan.expiry) await pick('expiry', locs.expiry, locs.expiry_option);
+    if (plan.expiry_date) await fillPicker('expiry_date', locs.expiry_date, plan.expiry_date);
+    if (plan.expiry_time) await fillPicker('expiry_time', locs.expiry_time, plan.expiry_time);
+    if (result.price === null) result.price = __aqxText(locs.symbol.price);
+    await new Promise(function (resolve) { setTimeout(resolve, 100); });
+    collectMessages();
+    return result;
+}
+run().then(done, function (e) { result.failed.script = String(e); done(result); });
+"""
+
+# Shared table walk: the header row is found from the 'Order No.' cell, rows are
+# the elements with the same shape as the header.
+_JS_TABLE = JS_LOCATE + """
+function __aqxTableHeader(container) {
+    var anchor = document.evaluate(".//*[normalize-space(text())='Order No.']", container, null,
+                                   XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!anchor) return null;
+    var node = anchor;
+    while (node.parentElement && node.parentElement !== container && node.parentElement.children.length < 8) {
+        node = node.parentElement;
+    }
+    var header = node.parentElement;
+    return {header: header, width: header.children.length,
+            orderCol: Array.prototype.indexOf.call(header.children, node)};
+}
+function __aqxIsRow(info, el) {
+    return el.nodeType === 1 && el !== info.header && el.children.length === info.width &&
+        !el.contains(info.header) && !info.header.contains(el);
+}
+function __aqxTableRows(container, info) {
+    var isRow = function (el) { return __aqxIsRow(info, el); };
+    var rows = Array.prototype.filter.call(info.header.parentElement.children, isRow);
+    if (!rows.length) rows = Array.prototype.filter.call(container.querySelectorAll(info.header.tagName), isRow);
+    return rows;
+}
+"""
+
+# Position/pending table walk in one round-trip. textContent is used instead of
+# innerText so hundreds of rows don't force layout.
+_JS_READ_TABLE = _JS_TABLE + """
+var container = __aqxLocate(arguments[0][0], arguments[0][1])[0];
+if (!container) return null;
+var info = __aqxTableHeader(container);
+if (!info) return {headers: [], rows: []};
+function cells(row) {
+    return Array.prototype.map.call(row.children, function (cell) { return (cell.textContent || '').trim(); });
+}
+return {headers: cells(info.header), rows: __aqxTableRows(container, info).map(cells)};
+"""
+
+# Order IDs currently shown in the positions/pending table
+_JS_TABLE_ORDER_IDS = _JS_TABLE + """
+var container = __aqxLocate(arguments[0][0], arguments[0][1])[0];
+var info = container && __aqxTableHeader(container);
+if (!info) return [];
+return __aqxTableRows(container, info).map(function (row) {
+    var cell = row.children[info.orderCol];
+    return cell ? (cell.textContent || '').trim() : '';
+}).filter(function (id) { return id; });
+"""
+
+# Resolves once the table's order IDs differ from `known` - an ID was added
+# (mode "added"), added/removed (mode "any") or the table is empty (mode
+# "empty") - or an order error message is visible (errorLoc may be null), or
+# on timeout: {ids, added, removed, error}. A table that is not rendered yet
+# (no container or header) is unknown, not empty: ids is null until it shows
+# up. Removals and emptiness only count once the table has been stable for
+# settleMs, so a table that is still filling after a tab switch does not
+# report every known order as removed.
+_JS_WAIT_TABLE_CHANGE = _JS_TABLE + """
+var containerLoc = arguments[0], known = arguments[1], errorLoc = arguments[2];
+var timeoutMs = arguments[3], mode = arguments[4];
+var done = arguments[arguments.length - 1];
+var settleMs = 250, settleTimer = null, timer = null, observer = null, finished = false;
+var knownSet = {};
+known.forEach(function (id) { knownSet[id] = true; });
+function ids() {
+    var container = __aqxLocate(containerLoc[0], containerLoc[1])[0];
+    var info = container && __aqxTableHeader(container);
+    if (!info) return null;
+    return __aqxTableRows(container, info).map(function (row) {
+        var cell = row.children[info.orderCol];
+        return cell ? (cell.textContent || '').trim() : '';
+    }).filter(function (id) { return id; });
+}
+function visibleError() {
+    if (!errorLoc) return null;
+    try {
+        // Messages already shown before the action are marked by _JS_MARK_ERRORS
+        var el = __aqxLocate(errorLoc[0], errorLoc[1]).filter(function (el) {
+            return __aqxVisible(el) && el.__aqxStaleText !== (el.innerText || '').trim();
+        })[0];
+        return el ? (el.innerText || '').trim() : null;
+    } catch (e) { return null; }
+}
+// Returns [result, needsSettle], or null while nothing relevant happened
+function check(final) {
+    var current = ids(), error = visibleError();
+    if (current === null) {
+        return error || final ? [{ids: null, added: [], removed: [], error: error}, false] : null;
+    }
+    var currentSet = {};
+    current.forEach(function (id) { currentSet[id] = true; });
+    var added = current.filter(function (id) { return !knownSet[id]; });
+    var removed = known.filter(function (id) { return !currentSet[id]; });
+    var result = {ids: current, added: added, removed: removed, error: error};
+    if (final || error || (mode !== 'empty' && added.length)) return [result, false];
+    if (mode === 'empty' ? !current.length : mode === 'any' && removed.length) return [result, true];
+    return null;
+}
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(settleTimer);
+    done(result);
+}
+function update() {
+    clearTimeout(settleTimer);
+    var seen = check(false);
+    if (!seen) return;
+    if (!seen[1]) { finish(seen[0]); return; }
+    settleTimer = setTimeout(function () {
+        var again = check(false);
+        if (again) finish(again[0]);
+    }, settleMs);
+}
+observer = new MutationObserver(update);
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+timer = setTimeout(function () { finish(check(true)[0]); }, timeoutMs);
+update();
+"""
+
+# Marks the error messages visible right now, so a toast left over from the
+# previous order is not taken for the outcome of the next one
+_JS_MARK_ERRORS = JS_LOCATE + """
+__aqxLocate(arguments[0][0], arguments[0][1]).forEach(function (el) {
+    if (__aqxVisible(el)) el.__aqxStaleText = (el.innerText || '').trim();
+});
+"""
+
+# Order ID -> row index kept on the table container. Built in one pass, then
+# kept current by a MutationObserver (rows added/removed, row text reused for
+# another order); rebuilt when the header is replaced (tab switch).
+_JS_ROW_BUTTON = _JS_TABLE + """
+var containerLoc = arguments[0], orderId = arguments[1], testid = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var container = __aqxLocate(containerLoc[0], containerLoc[1])[0];
+if (!container) { done(null); return; }
+
+function buildIndex() {
+    var info = __aqxTableHeader(container);
+    var idx = {info: info, rows: {}, observer: null};
+    container.__aqxRowIndex = idx;
+    if (!info) return idx;
+    function rowId(row) {
+        var cell = row.children[info.orderCol];
+        return cell ? (cell.textContent || '').trim() : '';
+    }
+    function add(row) {
+        var id = rowId(row);
+        row.__aqxOrderId = id;
+        if (id) idx.rows[id] = row;
+    }
+    function remove(row) {
+        if (row.__aqxOrderId && idx.rows[row.__aqxOrderId] === row) delete idx.rows[row.__aqxOrderId];
+    }
+    __aqxTableRows(container, info).forEach(add);
+    idx.observer = new MutationObserver(function (mutations) {
+        mutations.forEach(function (m) {
+            if (m.type === 'childList') {
+                m.removedNodes.forEach(function (n) { if (n.nodeType === 1 && __aqxIsRow(info, n)) remove(n); });
+                m.addedNodes.forEach(function (n) { if (n.nodeType === 1 && __aqxIsRow(info, n)) add(n); });
+            }
+            var el = m.target.nodeType === 1 ? m.target : m.target.parentElement;
+            while (el && el !== container) {
+                if (el.__aqxOrderId !== undefined) { remove(el); add(el); break; }
+                el = el.parentElement;
+            }
+        });
+    });
+    idx.observer.observe(container, {childList: true, subtree: true, characterData: true});
+    return idx;
+}
+function lookup() {
+    var idx = container.__aqxRowIndex;
+    if (!idx || !idx.info || !idx.info.header.isConnected) {
+        if (idx && idx.observer) idx.observer.disconnect();
+        idx = buildIndex();
+    }
+    var row = idx.rows[orderId];
+    if (row && !row.isConnected) {
+        idx.observer.disconnect();
+        row = buildIndex().rows[orderId];
+    }
+    return row ? row.querySelector('[data-testid="' + testid + '"]') : null;
+}
+
+var button = lookup();
+if (button) { done(button); return; }
+var waiter = new MutationObserver(function () {
+    var button = lookup();
+    if (button) { waiter.disconnect(); clearTimeout(timer); done(button); }
+});
+waiter.observe(container, {childList: true, subtree: true, characterData: true});
+var timer = setTimeout(function () { waiter.disconnect(); done(lookup()); }, timeoutMs);
+"""
+
+
+# One step of the notification collector: read the mounted items (innerText
+# keeps the line breaks the parser relies on), then scroll one viewport down.
+_JS_HARVEST_NOTIFICATIONS = JS_LOCATE + """
+var scroller = arguments[0], itemLoc = arguments[1];
+var items = __aqxLocate(itemLoc[0], itemLoc[1], scroller).map(function (item) {
+    var title = item.querySelector('[data-testid="notification-list-result-item-title"]');
+    return {text: (item.innerText || '').trim(), title: title ? (title.textContent || '').trim() || null : null};
+}).filter(function (item) { return item.text; });
+var top = scroller.scrollTop;
+var atEnd = top + scroller.clientHeight >= scroller.scrollHeight - 2;
+if (!atEnd) scroller.scrollTop = top + Math.max(scroller.clientHeight, 1);
+return {items: items, top: top, atEnd: atEnd};
+"""
+
+
 class WebTradePagePOM(BasePage):
     """POM for WebTrade page - trading interface"""
     
     # Locators
     CHART_CONTAINER = (By.XPATH, "//div[contains(@class,'chart') or contains(@class,'chart-container')]")
     TRADE_SYMBOL_INPUT = (By.XPATH, "//input[contains(translate(@placeholder,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'symbol')]")
-    PRICE_DISPLAY = (By.XPATH, "//div[@class='sc-bca4f92-0 kkrurn']//div)[2]]")
+    PRICE_DISPLAY = (By.XPATH, "(//div[@class='sc-bca4f92-0 kkrurn']//div)[2]")
     CURRENT_TIME_DISPLAY = (By.XPATH, "//div[@class='sc-5d3a04eb-0 fsRkWV']/following-sibling::div[1]")
 
 
@@ -29,54 +385,156 @@ class WebTradePagePOM(BasePage):
     STOP_LOSS_INPUT = (By.XPATH, "//input[@name='stopLoss']")
     TAKE_PROFIT_INPUT = (By.XPATH, "//input[@name='takeProfit']")
     
+    # Option lists: the element holding the options as direct children. The
+    # ticket also shows the selected value as a div with the same text, so
+    # options are only looked up inside their list, never by document order.
+    ORDER_TYPE_LIST = "//*[div[normalize-space(text())='Limit'] and div[normalize-space(text())='Stop Limit']]"
+    EXPIRY_LIST = "//*[div[normalize-space(text())='Good Till Canceled'] and div[normalize-space(text())='Specified Date']]"
+    
     ORDER_TYPE_DROPDOWN = (By.XPATH, "(//div[text()='Market']/following-sibling::div)[1]")
-    MARKET_OPTION = (By.XPATH, "//div[normalize-space(text())='Market']")
-    LIMIT_OPTION = (By.XPATH, "//div[normalize-space(text())='Limit']")
-    STOP_OPTION = (By.XPATH, "//div[normalize-space(text())='Stop']")
-    STOP_LIMIT_OPTION = (By.XPATH, "//div[normalize-space(text())='Stop Limit']")
-
-    EXPIRY_TYPE_DROPDOWN = (By.XPATH, "(//div[text()='Good Till Day']/following-sibling::div")
-    GOOD_TILL_CANCELED_OPTION = (By.XPATH, "//div[normalize-space(text())='Good Till Canceled']")
-    GOOD_TILL_DAY_OPTION = (By.XPATH, "(//div[normalize-space(text())='Good Till Day']")
-    SPECIFIED_DATE_AND_TIME_OPTION = (By.XPATH, "//div[normalize-space(text())='Specified Date and Time']")
-    SPECIFIED_DATE_OPTION = (By.XPATH, "//div[normalize-space(text())='Specified Date']")
+    MARKET_OPTION = (By.XPATH, ORDER_TYPE_LIST + "/div[normalize-space(text())='Market']")
+    LIMIT_OPTION = (By.XPATH, ORDER_TYPE_LIST + "/div[normalize-space(text())='Limit']")
+    STOP_OPTION = (By.XPATH, ORDER_TYPE_LIST + "/div[normalize-space(text())='Stop']")
+    STOP_LIMIT_OPTION = (By.XPATH, ORDER_TYPE_LIST + "/div[normalize-space(text())='Stop Limit']")
+
+    EXPIRY_TYPE_DROPDOWN = (By.XPATH, "(//div[text()='Good Till Day']/following-sibling::div)[1]")
+    GOOD_TILL_CANCELED_OPTION = (By.XPATH, EXPIRY_LIST + "/div[normalize-space(text())='Good Till Canceled']")
+    GOOD_TILL_DAY_OPTION = (By.XPATH, EXPIRY_LIST + "/div[normalize-space(text())='Good Till Day']")
+    SPECIFIED_DATE_AND_TIME_OPTION = (By.XPATH, EXPIRY_LIST + "/div[normalize-space(text())='Specified Date and Time']")
+    SPECIFIED_DATE_OPTION = (By.XPATH, EXPIRY_LIST + "/div[normalize-space(text())='Specified Date']")
     EXPIRY_DATE_INPUT = (By.XPATH, "(//div[@data-testid='trade-input-expiry-date']//div)[1]")
     EXPIRY_TIME_INPUT = (By.XPATH, "(//div[@data-testid='trade-input-expiry-time']//div)[1]")
     
+    # Ticket fields the app keeps after a placement; place_orders() only
+    # re-applies them when they change between consecutive orders. The app
+    # resets order type (to Market), expiry (to Good Till Day), SL, TP and the
+    # expiry date/time after each order, so those are always re-applied.
+    STICKY_TICKET_FIELDS = ('symbol', 'side', 'volume')
+    
+    # Order tables that can be snapshotted -> method opening their tab
+    ORDER_TABLE_TABS = {
+        'positions': 'open_positions_tab',
+        'pending': 'open_pending_order_tab'
+    }
+    
+    ORDER_TYPE_OPTIONS = {
+        'market': MARKET_OPTION,
+        'limit': LIMIT_OPTION,
+        'stop': STOP_OPTION,
+        'stop limit': STOP_LIMIT_OPTION
+    }
+    EXPIRY_OPTIONS = {
+        'Good Till Canceled': GOOD_TILL_CANCELED_OPTION,
+        'Good Till Day': GOOD_TILL_DAY_OPTION,
+        'Specified Date and Time': SPECIFIED_DATE_AND_TIME_OPTION,
+        'Specified Date': SPECIFIED_DATE_OPTION
+    }
+    
     BUY_BUTTON = (By.XPATH, "//button[@data-testid='trade-button-order-buy']")
     SELL_BUTTON = (By.XPATH, "//button[@data-testid='trade-button-order-sell']")
     PLACE_ORDER_BTN = (By.XPATH, "//button[@data-testid='trade-button-order']")
+    # Toast texts taken from the mock app ("Order placed successfully", ...) -
+    # not yet checked against production, where a mismatch makes
+    # click_place_order() return None after its timeout
+    ORDER_SUCCESS_MESSAGE = (By.XPATH, "//div[contains(text(), 'successfully')]")
+    ORDER_ERROR_MESSAGE = (By.XPATH, "//div[contains(text(), 'Invalid') or contains(text(), 'Insufficient') or contains(text(), 'failed')]")
     
     OPEN_POSITIONS_TAB = (By.XPATH, "//div[contains(., 'Open Positions')]")
     PENDING_ORDERS_TAB = (By.XPATH, "//div[contains(., 'Pending Orders')]")
     POSITIONS_HISTORY_TAB = (By.XPATH, "//div[contains(., 'Positions History')]")
     POSITION_CONTAINER = (By.XPATH, "//div[@class='sc-dvmDTH isBNLJ']")
     
+    # Table header -> Position field for read_positions()
+    POSITION_COLUMNS = {
+        'Open Date': 'open_date',
+        'Order No.': 'order_id',
+        'Symbol': 'symbol',
+        'Type': 'type',
+        'Profit/Loss': 'profit',
+        'Volume': 'volume',
+        'Units': 'units',
+        'Entry Price': 'entry_price',
+        'Current Price': 'current_price',
+        'Take Profit': 'take_profit',
+        'Stop Loss': 'stop_loss',
+        'Swap': 'swap'
+    }
+    
     EDIT_POSITION_BTN = (By.XPATH, "//button[@data-testid='asset-open-button-edit']")
     CLOSE_POSITION_BTN = (By.XPATH, "//button[@data-testid='asset-open-button-close']")
     BULK_CLOSE_BTN = (By.XPATH, "//div[@data-testid='bulk-close']")
+    CLOSE_CONFIRM_BTN = (By.XPATH, "//button[not(@data-testid='asset-open-button-close')][contains(text(), 'Close') or contains(text(), 'Confirm') or contains(text(), 'OK')]")
+    BULK_CLOSE_CONFIRM_BTN = (By.XPATH, "//button[contains(text(), 'Close All') or contains(text(), 'Confirm') or contains(text(), 'OK')]")
 
     NOTIFICATION_SELECTOR = (By.XPATH, "//div[@data-testid='notification-selector']")
     NOTIFICATION_LIST_RESULT_ITEM = (By.XPATH, "//div[@data-testid='notification-list-result-item']")
     NOTIFICATION_TITLES = (By.XPATH, "//div[@data-testid='notification-list-result-item-title']")
+    NOTIFICATION_SCROLLER = (By.XPATH, "//div[@data-testid='virtuoso-scroller']")
     
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.url = "https://aqxtrader.aquariux.com/web/trade"
+    # Cheaper equivalents found with utils/locator_audit.py (opt in with AQX_FAST_LOCATORS=1).
+    # The tab XPaths match the text-holding div only instead of every ancestor div.
+    FAST_LOCATORS = {
+        'CHART_CONTAINER': (By.CSS_SELECTOR, "div[class*='chart']"),
+        'TRADE_SYMBOL_INPUT': (By.CSS_SELECTOR, "input[placeholder*='symbol' i]"),
+        'SYMBOL_OVERVIEW_TITLE': (By.CSS_SELECTOR, "div[data-testid='symbol-overview-id']"),
+        'VOLUME_INPUT': (By.CSS_SELECTOR, "input[name='lotSize']"),
+        'STOP_LOSS_INPUT': (By.CSS_SELECTOR, "input[name='stopLoss']"),
+        'TAKE_PROFIT_INPUT': (By.CSS_SELECTOR, "input[name='takeProfit']"),
+        'BUY_BUTTON': (By.CSS_SELECTOR, "button[data-testid='trade-button-order-buy']"),
+        'SELL_BUTTON': (By.CSS_SELECTOR, "button[data-testid='trade-button-order-sell']"),
+        'PLACE_ORDER_BTN': (By.CSS_SELECTOR, "button[data-testid='trade-button-order']"),
+        'OPEN_POSITIONS_TAB': (By.XPATH, "//div[contains(text(), 'Open Positions')]"),
+        'PENDING_ORDERS_TAB': (By.XPATH, "//div[contains(text(), 'Pending Orders')]"),
+        'POSITIONS_HISTORY_TAB': (By.XPATH, "//div[contains(text(), 'Positions History')]"),
+        'POSITION_CONTAINER': (By.CSS_SELECTOR, "div[class='sc-dvmDTH isBNLJ']"),
+        'EDIT_POSITION_BTN': (By.CSS_SELECTOR, "button[data-testid='asset-open-button-edit']"),
+        'CLOSE_POSITION_BTN': (By.CSS_SELECTOR, "button[data-testid='asset-open-button-close']"),
+        'BULK_CLOSE_BTN': (By.CSS_SELECTOR, "div[data-testid='bulk-close']"),
+        'NOTIFICATION_SELECTOR': (By.CSS_SELECTOR, "div[data-testid='notification-selector']"),
+        'NOTIFICATION_LIST_RESULT_ITEM': (By.CSS_SELECTOR, "div[data-testid='notification-list-result-item']"),
+        'NOTIFICATION_TITLES': (By.CSS_SELECTOR, "div[data-testid='notification-list-result-item-title']"),
+        'NOTIFICATION_SCROLLER': (By.CSS_SELECTOR, "div[data-testid='virtuoso-scroller']"),
+    }
     
-    def open_page(self):
-        """Open WebTrade page"""
+    def __init__(self, driver, base_url=None, fast_locators=None):
+        super().__init__(driver, fast_locators)
+        self.base_url = base_url or get_base_url()
+        self.url = f"{self.base_url}/web/trade"
+        # AQX_UI_FIDELITY=1 keeps real char-by-char typing for UI-fidelity runs
+        self.fast_input = os.getenv("AQX_UI_FIDELITY", "0") != "1"
+        self.current_tab = None
+    
+    def open_page(self, redirect=None, timeout=None):
+        """
+        Open WebTrade page
+        
+        Args:
+            redirect: Optional locator of the page the app sends the browser to
+                      instead (e.g. LoginPagePOM.LOGIN_FORM for a refused session);
+                      the wait then ends as soon as either page shows
+            timeout: Maximum wait for the page (default 10s)
+        
+        Returns:
+            WebTradePagePOM: self (check driver.current_url after a redirect)
+        """
         self.driver.get(self.url)
-        self.wait.until(EC.visibility_of_element_located(self.CHART_CONTAINER))
-        print(f"[✓] WebTrade loaded")
+        self.invalidate_elements()
+        conditions = {"trade": OC.visibility_of_element_located(self.CHART_CONTAINER)}
+        if redirect:
+            conditions["redirect"] = OC.visibility_of_element_located(redirect)
+        outcome, _ = self.wait_for_any(conditions, timeout=timeout)
+        if outcome == "redirect":
+            print(f"[!] WebTrade redirected to {self.driver.current_url}")
+        else:
+            print("[✓] WebTrade loaded")
         return self
     
     def verify_page_loaded(self):
         """Verify page loaded successfully"""
         try:
-            self.wait.until(EC.visibility_of_element_located(self.CHART_CONTAINER))
-            self.wait.until(EC.visibility_of_element_located(self.BUY_BUTTON))
-            self.wait.until(EC.visibility_of_element_located(self.SELL_BUTTON))
+            self.wait_until(OC.visibility_of_element_located(self.CHART_CONTAINER))
+            self.wait_until(OC.visibility_of_element_located(self.BUY_BUTTON))
+            self.wait_until(OC.visibility_of_element_located(self.SELL_BUTTON))
             return True
         except:
             return False
@@ -84,7 +542,7 @@ class WebTradePagePOM(BasePage):
     def click_buy(self):
         """Click the buy button"""
         try:
-            self.driver.find_element(*self.BUY_BUTTON).click()
+            self.click_element(self.BUY_BUTTON)
             print(f"[✓] Clicked Buy button")
             return True
         except:
@@ -93,108 +551,132 @@ class WebTradePagePOM(BasePage):
     def click_sell(self):
         """Click the sell button"""
         try:
-            self.driver.find_element(*self.SELL_BUTTON).click()
+            self.click_element(self.SELL_BUTTON)
             print(f"[✓] Clicked Sell button")
             return True
         except:
             return False
 
-    def input_symbol(self, symbol):
-        """Input symbol and verify"""
-        symbol_input = self.driver.find_element(*self.TRADE_SYMBOL_INPUT)
-        symbol_input.clear()
-        time.sleep(0.2)
-        symbol_input.click()
-        time.sleep(0.2)
-        
-        for char in symbol:
-            symbol_input.send_keys(char)
-            time.sleep(0.1)
-        time.sleep(0.5)
+    def input_symbol(self, symbol, fast=None):
+        """
+        Input symbol, select it from the dropdown and return the current price
+        
+        Args:
+            symbol: Symbol to trade (e.g. "XAUUSD")
+            fast: Set the value in one script call instead of typing char by char
+                  (default: self.fast_input)
+        
+        Returns:
+            str: Current price text, or None if not found
+        """
+        if self.fast_input if fast is None else fast:
+            result = self._input_symbol_fast(symbol)
+            if result is not None:
+                return result.get("price")
+            print("[!] Fast symbol input failed, falling back to typing")
+        
+        def type_slowly(symbol_input):
+            symbol_input.clear()
+            symbol_input.click()
+            for char in symbol:
+                symbol_input.send_keys(char)
+                time.sleep(0.1)
+        
+        self.with_element(self.TRADE_SYMBOL_INPUT, type_slowly)
+        if not self.wait_for_dom_settled(condition=self.SYMBOL_DROPDOWN_RESULT, timeout=3):
+            print(f"[!] No search result for {symbol}")
         print(f"[✓] Symbol: {symbol}")
         
         try:
             self.driver.find_element(*self.SYMBOL_DROPDOWN_RESULT).click()
-            title = self.driver.find_element(*self.SYMBOL_OVERVIEW_TITLE).text.strip()
+            title = self.element_text(self.SYMBOL_OVERVIEW_TITLE)
             print(f"[✓] Verified: {title}")
         except:
             pass
         
         return self.get_current_price()
     
+    def _input_symbol_fast(self, symbol, timeout=3):
+        """Fast path of input_symbol(): returns {"title", "price"} or None on failure"""
+        try:
+            result = self.run_async_script(
+                _JS_FAST_SYMBOL, self._symbol_locators(), symbol, int(timeout * 1000), timeout=timeout)
+        except Exception as e:
+            print(f"[!] Fast symbol input error: {e}")
+            return None
+        if not result or result.get("error"):
+            return None
+        print(f"[✓] Symbol: {symbol}")
+        print(f"[✓] Verified: {result.get('title')}")
+        return result
+    
+    def _symbol_locators(self):
+        """Locators used by the in-page symbol picker"""
+        return {
+            "input": list(self.TRADE_SYMBOL_INPUT),
+            "result": list(self.SYMBOL_DROPDOWN_RESULT),
+            "title": list(self.SYMBOL_OVERVIEW_TITLE),
+            "price": list(self.PRICE_DISPLAY),
+        }
+    
     def get_current_price(self):
         """Get current price"""
         try:
-            return self.driver.find_element(*self.PRICE_DISPLAY).text.strip()
+            return self.element_text(self.PRICE_DISPLAY)
         except:
             return None
         
     def get_current_day(self):
         """Get current day"""
         try:
-            return self.driver.find_element(*self.CURRENT_TIME_DISPLAY).text.strip()
+            return self.element_text(self.CURRENT_TIME_DISPLAY)
         except:
             return None
     
     def select_order_type(self, order_type='Market'):
         """Select order type"""
-        self.driver.find_element(*self.ORDER_TYPE_DROPDOWN).click()
-        time.sleep(0.3)
-        
-        options = {
-            'market': self.MARKET_OPTION,
-            'limit': self.LIMIT_OPTION,
-            'stop': self.STOP_OPTION,
-            'stop limit': self.STOP_LIMIT_OPTION
-        }
+        self.click_element(self.ORDER_TYPE_DROPDOWN)
         
-        option_loc = options.get(order_type.lower())
+        option_loc = self.ORDER_TYPE_OPTIONS.get(order_type.lower())
         if not option_loc:
             raise ValueError(f"Unknown order type: {order_type}")
         
+        if not self.wait_for_dom_settled(condition=option_loc, timeout=2):
+            raise TimeoutException(f"Order type option '{order_type}' did not appear")
         self.driver.find_element(*option_loc).click()
         print(f"[✓] Order: {order_type}")
-        time.sleep(0.3)
+        self.wait_for_dom_settled(quiet=0.15, timeout=1)
         return self
     
     def select_order_expiry(self, expiry_type='Good Till Day'):
         """Select order expiry type"""
-        self.driver.find_element(*self.EXPIRY_TYPE_DROPDOWN).click()
-        time.sleep(0.3)
-        
-        options = {
-            'Good Till Canceled': self.GOOD_TILL_CANCELED_OPTION,
-            'Good Till Day': self.GOOD_TILL_DAY_OPTION,
-            'Specified Date and Time': self.SPECIFIED_DATE_AND_TIME_OPTION,
-            'Specified Date': self.SPECIFIED_DATE_OPTION
-        }
+        self.click_element(self.EXPIRY_TYPE_DROPDOWN)
         
-        option_loc = options.get(expiry_type)
+        option_loc = self.EXPIRY_OPTIONS.get(expiry_type)
         if not option_loc:
             raise ValueError(f"Unknown expiry type: {expiry_type}")
         
+        if not self.wait_for_dom_settled(condition=option_loc, timeout=2):
+            raise TimeoutException(f"Expiry option '{expiry_type}' did not appear")
         self.driver.find_element(*option_loc).click()
         print(f"[✓] Expiry: {expiry_type}")
         return self
     
     def input_volume(self, volume):
         """Input trading volume"""
-        self.driver.find_element(*self.VOLUME_INPUT).clear()
-        self.driver.find_element(*self.VOLUME_INPUT).send_keys(str(volume))
+        self.fill_field(self.VOLUME_INPUT, str(volume))
         print(f"[✓] Volume: {volume}")
         return self
     
     def input_stop_loss(self, price):
         """Input stop loss price"""
-        self.driver.find_element(*self.STOP_LOSS_INPUT).clear()
-        self.driver.find_element(*self.STOP_LOSS_INPUT).send_keys(f"{float(price):.2f}")
+        self.fill_field(self.STOP_LOSS_INPUT, f"{float(price):.2f}")
         print(f"[✓] SL: {price:.2f}")
         return self
     
     def input_take_profit(self, price):
         """Input take profit price"""
-        self.driver.find_element(*self.TAKE_PROFIT_INPUT).clear()
-        self.driver.find_element(*self.TAKE_PROFIT_INPUT).send_keys(f"{float(price):.2f}")
+        self.fill_field(self.TAKE_PROFIT_INPUT, f"{float(price):.2f}")
         print(f"[✓] TP: {price:.2f}")
         return self
 
@@ -202,7 +684,7 @@ class WebTradePagePOM(BasePage):
         """Input expiry date string into expiry date field."""
         try:
             self._click_when_clickable(self.EXPIRY_DATE_INPUT)
-            time.sleep(0.2)
+            self.wait_for_dom_settled(quiet=0.1, timeout=1)
             el = self.driver.switch_to.active_element
             try:
                 el.clear()
@@ -220,7 +702,7 @@ class WebTradePagePOM(BasePage):
         """Input expiry time string into expiry time field."""
         try:
             self._click_when_clickable(self.EXPIRY_TIME_INPUT)
-            time.sleep(0.2)
+            self.wait_for_dom_settled(quiet=0.1, timeout=1)
             el = self.driver.switch_to.active_element
             try:
                 el.clear()
@@ -238,42 +720,452 @@ class WebTradePagePOM(BasePage):
         """Set expiry to next day at 12:00."""
         return self.set_expiry_plus_days(1, "12:00")
     
-    def click_place_order(self):
-        """Confirm order placement"""
-        self.driver.find_element(*self.PLACE_ORDER_BTN).click()
+    def fill_order_ticket(self, side=None, symbol=None, order_type=None, volume=None, sl=None, tp=None,
+                          expiry=None, expiry_date=None, expiry_time=None, step_timeout=3):
+        """
+        Fill the whole order ticket in a single injected script
+        
+        Replaces the click_buy / input_symbol / select_order_type / input_volume /
+        input_stop_loss / input_take_profit / select_order_expiry / expiry date and
+        time sequence (10-15 WebDriver calls) with one round-trip. Fields left as
+        None are not touched. The order is not placed - call click_place_order().
+        
+        Args:
+            side: "buy" or "sell" (None keeps the side currently selected)
+            symbol: Optional symbol to select (e.g. "XAUUSD")
+            order_type: Optional order type ("Market", "Limit", "Stop", "Stop Limit")
+            volume: Optional volume
+            sl: Optional stop loss price
+            tp: Optional take profit price
+            expiry: Optional expiry type (key of EXPIRY_OPTIONS)
+            expiry_date: Optional expiry date string
+            expiry_time: Optional expiry time string (e.g. "12:00")
+            step_timeout: Maximum wait for each dropdown/option to appear
+        
+        Returns:
+            dict: {"ok", "applied", "failed", "messages", "title", "price"} where
+                  applied lists the fields set, failed maps field -> reason and
+                  messages holds validation messages shown after the fill
+        """
+        if side is not None and side.lower() not in ("buy", "sell"):
+            raise ValueError(f"Unknown side: {side}")
+        order_type_loc = self.ORDER_TYPE_OPTIONS.get(order_type.lower()) if order_type else None
+        if order_type and not order_type_loc:
+            raise ValueError(f"Unknown order type: {order_type}")
+        expiry_loc = self.EXPIRY_OPTIONS.get(expiry) if expiry else None
+        if expiry and not expiry_loc:
+            raise ValueError(f"Unknown expiry type: {expiry}")
+        
+        locators = {
+            "buy": list(self.BUY_BUTTON),
+            "sell": list(self.SELL_BUTTON),
+            "symbol": self._symbol_locators(),
+            "order_type": list(self.ORDER_TYPE_DROPDOWN),
+            "order_type_option": list(order_type_loc) if order_type_loc else None,
+            "volume": list(self.VOLUME_INPUT),
+            "sl": list(self.STOP_LOSS_INPUT),
+            "tp": list(self.TAKE_PROFIT_INPUT),
+            "expiry": list(self.EXPIRY_TYPE_DROPDOWN),
+            "expiry_option": list(expiry_loc) if expiry_loc else None,
+            "expiry_date": list(self.EXPIRY_DATE_INPUT),
+            "expiry_time": list(self.EXPIRY_TIME_INPUT),
+            "error": list(self.ORDER_ERROR_MESSAGE),
+        }
+        plan = {
+            "side": side.lower() if side else None,
+            "symbol": symbol,
+            "order_type": order_type,
+            "volume": str(volume) if volume is not None else None,
+            "sl": f"{float(sl):.2f}" if sl is not None else None,
+            "tp": f"{float(tp):.2f}" if tp is not None else None,
+            "expiry": expiry,
+            "expiry_date": str(expiry_date) if expiry_date is not None else None,
+            "expiry_time": expiry_time,
+        }
+        
+        result = self.run_async_script(
+            _JS_FILL_TICKET, locators, plan, int(step_timeout * 1000), timeout=step_timeout * 6 + 3)
+        result["ok"] = not result["failed"] and not result["messages"]
+        
+        print(f"[✓] Ticket filled: {', '.join(result['applied']) or 'nothing'}")
+        for field, reason in result["failed"].items():
+            print(f"[!] Ticket field {field}: {reason}")
+        for message in result["messages"]:
+            print(f"[!] Ticket validation: {message}")
+        return result
+    
+    def click_place_order(self, timeout=5):
+        """
+        Confirm order placement and wait for the outcome
+        
+        Args:
+            timeout: Maximum wait for the success or error message
+        
+        Returns:
+            bool: True once the success message shows, False if the platform
+                  rejected the order, None if neither showed within timeout
+        """
+        self.click_element(self.PLACE_ORDER_BTN)
         print("[✓] Order confirmed")
-        time.sleep(0.5)
+        outcome, element = self.wait_for_order_outcome(timeout=timeout)
+        if outcome == "error":
+            print(f"[✗] Order rejected: {element.text}")
+            return False
+        if outcome is None:
+            print(f"[!] No order success or error message after {timeout}s")
+            return None
         return True
     
+    def wait_for_order_outcome(self, timeout=5):
+        """
+        Race the order success message against an error message
+        
+        Args:
+            timeout: Maximum wait time
+            
+        Returns:
+            tuple: ("success" | "error", WebElement), or (None, None) on timeout
+        """
+        try:
+            return self.wait_for_any({
+                "success": OC.visibility_of_element_located(self.ORDER_SUCCESS_MESSAGE),
+                "error": OC.visibility_of_element_located(self.ORDER_ERROR_MESSAGE),
+            }, timeout=timeout)
+        except TimeoutException:
+            return None, None
+    
+    def place_orders(self, batch, timeout=10):
+        """
+        Place a batch of orders, keeping the ticket open between them
+        
+        Each order is one fill_order_ticket() script call (STICKY_TICKET_FIELDS
+        - symbol, side, volume - are skipped when unchanged), a click on Place Order and
+        one wait that watches the positions (market) or pending (other types)
+        table for a new order ID, or an error message that appeared after the
+        click (messages still shown from the previous order are ignored). A new
+        row only counts when its side, symbol and volume match the order.
+        
+        Args:
+            batch: List of dicts with fill_order_ticket() keys
+                   (side, symbol, order_type, volume, sl, tp, expiry, expiry_date, expiry_time)
+            timeout: Maximum wait for each order to show up
+        
+        Returns:
+            dict: {"orders": [{"index", "order_id", "outcome", "latency", "messages"}, ...],
+                   "placed", "duration", "orders_per_min"} where outcome is
+                   "placed", "rejected", "invalid" (ticket fill failed), "ambiguous"
+                   (several new rows match the order's side, symbol and volume) or "timeout"
+        """
+        results = []
+        previous = {}
+        previous_symbol = None
+        known = None
+        started = time.perf_counter()
+        
+        for index, order in enumerate(batch):
+            fields = dict(order)
+            for field in self.STICKY_TICKET_FIELDS:
+                if field in previous and fields.get(field) == previous.get(field):
+                    fields.pop(field, None)
+            previous = order
+            previous_symbol = order.get("symbol") or previous_symbol
+            
+            tab = "positions" if (order.get("order_type") or "Market").lower() == "market" else "pending"
+            if self.current_tab != tab or known is None:
+                self._switch_tab(tab)
+                known = self.driver.execute_script(_JS_TABLE_ORDER_IDS, list(self.POSITION_CONTAINER))
+            
+            filled = self.fill_order_ticket(**fields)
+            if filled["failed"]:
+                results.append({"index": index, "order_id": None, "outcome": "invalid",
+                                "latency": 0.0, "messages": list(filled["failed"].values()) + filled["messages"]})
+                previous = {}
+                continue
+            
+            self.driver.execute_script(_JS_MARK_ERRORS, list(self.ORDER_ERROR_MESSAGE))
+            placed_at = time.perf_counter()
+            self.click_element(self.PLACE_ORDER_BTN)
+            # New rows that aren't this order (another worker trading the same
+            # account) are added to `known` and the wait goes on
+            match = {"type": order.get("side"), "symbol": previous_symbol,
+                     "volume": order.get("volume")}
+            outcome, order_id, messages = "timeout", None, []
+            while True:
+                wait = max(placed_at + timeout - time.perf_counter(), 0)
+                seen = self.run_async_script(
+                    _JS_WAIT_TABLE_CHANGE, list(self.POSITION_CONTAINER), known,
+                    list(self.ORDER_ERROR_MESSAGE), int(wait * 1000), "added", timeout=wait)
+                if seen["ids"] is not None:
+                    known = seen["ids"]
+                if seen["added"]:
+                    rows = {str(p.order_id): p for p in self.read_positions()}
+                    candidates = [i for i in seen["added"] if i in rows and rows[i].matches(**match)]
+                    if len(candidates) == 1:
+                        outcome, order_id = "placed", candidates[0]
+                    elif candidates:
+                        outcome, messages = "ambiguous", [f"{len(candidates)} new orders match: {candidates}"]
+                    elif wait > 0:
+                        continue
+                elif seen["error"]:
+                    outcome, messages = "rejected", [seen["error"]]
+                break
+            latency = time.perf_counter() - placed_at
+            results.append({"index": index, "order_id": order_id, "outcome": outcome,
+                            "latency": latency, "messages": messages})
+            print(f"[{'✓' if outcome == 'placed' else '!'}] Order {index + 1}/{len(batch)}: "
+                  f"{outcome} {order_id or ''} ({latency * 1000:.0f}ms)")
+        
+        duration = time.perf_counter() - started
+        placed = sum(1 for r in results if r["outcome"] == "placed")
+        per_min = placed / duration * 60 if duration else 0.0
+        latencies = [r["latency"] for r in results if r["outcome"] == "placed"]
+        print(f"[✓] Placed {placed}/{len(batch)} orders in {duration:.1f}s ({per_min:.1f} orders/min)")
+        if latencies:
+            print(f"    Placement latency: avg {sum(latencies) / len(latencies) * 1000:.0f}ms, "
+                  f"max {max(latencies) * 1000:.0f}ms")
+        return {"orders": results, "placed": placed, "duration": duration, "orders_per_min": per_min}
+    
+    def sweep_orders(self, tabs=("positions", "pending"), timeout=10):
+        """
+        Close every leftover open position and pending order
+        
+        Each table is bulk-closed first; orders still listed afterwards are
+        closed row by row. Emptiness is verified with an in-page wait.
+        
+        Args:
+            tabs: ORDER_TABLE_TABS keys to sweep
+            timeout: Maximum wait for a table to empty after each close pass
+        
+        Returns:
+            dict: {tab: {"leaked", "closed", "remaining"}} with order ID lists
+        """
+        report = {}
+        for tab in tabs:
+            self._switch_tab(tab)
+            leaked = self.driver.execute_script(_JS_TABLE_ORDER_IDS, list(self.POSITION_CONTAINER))
+            remaining = leaked
+            if leaked:
+                try:
+                    self.bulk_close_positions(confirm=True)
+                except Exception as e:
+                    print(f"[!] Bulk close failed during sweep: {e}")
+                remaining = self._wait_table_empty(timeout, remaining)
+                for order_id in remaining:
+                    try:
+                        self.close_position(order_id=order_id, confirm=True)
+                    except Exception as e:
+                        print(f"[!] Could not close order {order_id}: {e}")
+                if remaining:
+                    remaining = self._wait_table_empty(timeout, remaining)
+            still_listed = set(remaining)
+            report[tab] = {"leaked": leaked, "closed": [i for i in leaked if i not in still_listed],
+                           "remaining": remaining}
+            print(f"[✓] Sweep {tab}: {len(leaked)} leaked, {len(remaining)} remaining")
+        return report
+    
+    def _wait_table_empty(self, timeout, listed):
+        """
+        Wait for the current order table to be empty
+        
+        Returns:
+            list: Order IDs still listed (`listed` when the table never rendered)
+        """
+        seen = self.run_async_script(
+            _JS_WAIT_TABLE_CHANGE, list(self.POSITION_CONTAINER), [], None, int(timeout * 1000), "empty",
+            timeout=timeout)
+        return listed if seen["ids"] is None else seen["ids"]
+    
+    def _confirm_close(self, confirm_locator, timeout=3):
+        """
+        Race the close confirmation dialog against an immediate outcome
+        
+        Returns:
+            str: "confirmed", "success", "error" or None if nothing appeared
+        """
+        try:
+            outcome, element = self.wait_for_any({
+                "confirm": OC.element_to_be_clickable(confirm_locator),
+                "success": OC.visibility_of_element_located(self.ORDER_SUCCESS_MESSAGE),
+                "error": OC.visibility_of_element_located(self.ORDER_ERROR_MESSAGE),
+            }, timeout=timeout)
+        except TimeoutException:
+            return None
+        
+        if outcome == "confirm":
+            element.click()
+            try:
+                outcome, element = self.wait_for_any({
+                    "success": OC.visibility_of_element_located(self.ORDER_SUCCESS_MESSAGE),
+                    "error": OC.visibility_of_element_located(self.ORDER_ERROR_MESSAGE),
+                    "dismissed": OC.invisibility_of_element_located(confirm_locator),
+                }, timeout=timeout)
+            except TimeoutException:
+                outcome = None
+            if outcome == "error":
+                print(f"[!] Close rejected: {element.text}")
+                return "error"
+            return "confirmed"
+        if outcome == "error":
+            print(f"[!] Close rejected: {element.text}")
+        return outcome
+    
     def open_positions_tab(self):
         """Open positions tab"""
-        self.driver.find_element(*self.OPEN_POSITIONS_TAB).click()
+        self.click_element(self.OPEN_POSITIONS_TAB)
+        self.invalidate_elements()
+        self.current_tab = "positions"
         print("[✓] Positions tab")
-        time.sleep(0.5)
+        self.wait_for_dom_settled(quiet=0.2, timeout=2)
         return True
 
     def open_pending_order_tab(self):
         """Open pending order tab"""
-        self.driver.find_element(*self.PENDING_ORDERS_TAB).click()
+        self.click_element(self.PENDING_ORDERS_TAB)
+        self.invalidate_elements()
+        self.current_tab = "pending"
         print("[✓] Pending order tab")
-        time.sleep(0.5)
+        self.wait_for_dom_settled(quiet=0.2, timeout=2)
         return True
 
     def open_history_tab(self):
         """Open history tab"""
-        self.driver.find_element(*self.POSITIONS_HISTORY_TAB).click()
+        self.click_element(self.POSITIONS_HISTORY_TAB)
+        self.invalidate_elements()
+        self.current_tab = "history"
         print("[✓] History tab")
-        time.sleep(0.5)
+        self.wait_for_dom_settled(quiet=0.2, timeout=2)
         return True
     
+    def read_positions(self, columnar=False):
+        """
+        Read every row of the current positions/pending table in one script call
+        
+        Args:
+            columnar: Return a column-oriented RecordColumns (for large accounts)
+        
+        Returns:
+            list: Position records (int order_id, Decimal prices/volume, datetime
+                  open_date; empty cells are None), or RecordColumns if columnar
+        """
+        table = self._read_position_rows()
+        rows = table['rows'] if table else []
+        positions = RecordColumns(Position) if columnar else []
+        if rows:
+            fields = [self.POSITION_COLUMNS.get(header) for header in table['headers']]
+            for row in rows:
+                positions.append(Position.from_dict(
+                    {field: value for field, value in zip(fields, row) if field}))
+        print(f"[✓] {len(positions)} table rows")
+        return positions
+    
+    def _read_position_rows(self):
+        """Raw {"headers": [...], "rows": [[...], ...]} from the table, or None"""
+        try:
+            return self.driver.execute_script(_JS_READ_TABLE, list(self.POSITION_CONTAINER))
+        except Exception as e:
+            print(f"[!] Table extraction failed: {e}")
+            return None
+    
+    def _first_position_from_table(self):
+        """First table row as a Position, or None"""
+        table = self._read_position_rows()
+        if not table or not table['rows']:
+            return None
+        fields = [self.POSITION_COLUMNS.get(header) for header in table['headers']]
+        return Position.from_dict(
+            {field: value for field, value in zip(fields, table['rows'][0]) if field})
+    
+    def _switch_tab(self, tab):
+        """Open an ORDER_TABLE_TABS tab unless it is already shown"""
+        if self.current_tab != tab:
+            getattr(self, self.ORDER_TABLE_TABS[tab])()
+    
+    def snapshot_orders(self, tabs=("positions", "pending")):
+        """
+        Record the rows of the open positions / pending orders tables before an action
+        
+        Args:
+            tabs: ORDER_TABLE_TABS keys to snapshot
+        
+        Returns:
+            OrderSnapshot: Rows per tab keyed by order ID (pass it to diff_orders)
+        """
+        snapshot = OrderSnapshot()
+        for tab in tabs:
+            self._switch_tab(tab)
+            snapshot.tabs[tab] = {str(p.order_id): p for p in self.read_positions() if p.order_id is not None}
+        print("[✓] Snapshot: " + ", ".join(f"{tab} {len(rows)}" for tab, rows in snapshot.tabs.items()))
+        return snapshot
+    
+    def diff_orders(self, snapshot, expect="any", timeout=10, slice_timeout=1.0, match=None):
+        """
+        Wait for the rows added to (or removed from) the tables since a snapshot
+        
+        Starts with the tab currently shown and watches it in the page for up to
+        slice_timeout, then moves to the next snapshotted tab, until timeout.
+        With match, added rows that don't fit (e.g. orders another worker placed
+        on the same account) are ignored and the wait goes on.
+        
+        Args:
+            snapshot: OrderSnapshot from snapshot_orders()
+            expect: "added" (only new rows count) or "any" (new or removed rows)
+            timeout: Maximum total wait
+            slice_timeout: Wait per tab visit when more than one tab is snapshotted
+            match: Optional Position fields the added rows must have
+                   (e.g. {"type": "BUY", "symbol": "XAUUSD", "volume": 1.0})
+        
+        Returns:
+            OrderDiff: tab, added (Position records read after the action) and
+                       removed (Position records from the snapshot); empty on timeout
+        """
+        tabs = sorted(snapshot.tabs, key=lambda tab: tab != self.current_tab)
+        ignored = {tab: [] for tab in tabs}
+        deadline = time.perf_counter() + timeout
+        while True:
+            for tab in tabs:
+                self._switch_tab(tab)
+                before = snapshot.tabs[tab]
+                remaining = max(deadline - time.perf_counter(), 0)
+                wait = remaining if len(tabs) == 1 else min(slice_timeout, remaining)
+                seen = self.run_async_script(
+                    _JS_WAIT_TABLE_CHANGE, list(self.POSITION_CONTAINER), list(before) + ignored[tab],
+                    None, int(wait * 1000), expect, timeout=wait)
+                removed = seen["removed"] if expect == "any" else []
+                # Ignored rows that went away again are not removals of ours
+                ignored[tab] = [i for i in ignored[tab] if i not in removed]
+                removed = [before[i] for i in removed if i in before]
+                if seen["added"] or removed:
+                    after = {str(p.order_id): p for p in self.read_positions() if p.order_id is not None}
+                    added = [after[i] for i in seen["added"] if i in after]
+                    if match:
+                        ignored[tab] += [str(p.order_id) for p in added if not p.matches(**match)]
+                        added = [p for p in added if p.matches(**match)]
+                    if added or removed:
+                        diff = OrderDiff(tab, added, removed)
+                        print(f"[✓] {tab}: +{len(diff.added)} / -{len(diff.removed)} orders")
+                        return diff
+                    if seen["added"]:
+                        print(f"[*] {tab}: ignoring {len(seen['added'])} new orders not matching {match}")
+            if time.perf_counter() >= deadline:
+                print("[!] No order table change detected")
+                return OrderDiff(None, [], [])
+    
     def read_position_data(self):
-        """Read position data from positions table"""
+        """Read the first row of the positions table as a Position record"""
         try:
-            text = self.driver.find_element(*self.POSITION_CONTAINER).text.strip()
+            data = self._first_position_from_table()
+            if data:
+                titles = self._get_notification_titles(open_panel=True)
+                data.title = titles[0] if titles else None
+                print(f"[✓] Position data retrieved")
+                return data
+            
+            text = self.element_text(self.POSITION_CONTAINER)
             if text:
-                data = self._parse_position_table(text)
+                parsed = self._parse_position_table(text)
+                data = Position.from_dict({**parsed, 'open_date': parsed.get('date')})
                 titles = self._get_notification_titles(open_panel=True)
-                data['title'] = titles[0] if titles else None
+                data.title = titles[0] if titles else None
                 print(f"[✓] Position data retrieved")
                 return data
         except Exception as e:
@@ -283,50 +1175,56 @@ class WebTradePagePOM(BasePage):
     def read_information(self):
         """Read notification information from notification panel."""
         try:
-            self.driver.find_element(*self.NOTIFICATION_SELECTOR).click()
-            time.sleep(2.0)
-            
-            scroller = self.driver.find_element(By.XPATH, "//div[@data-testid='virtuoso-scroller']")
-            height = self.driver.execute_script("return arguments[0].scrollHeight;", scroller)
-            
-            for i in range(10):
-                self.driver.execute_script(f"arguments[0].scrollTop = {int(height * i / 10)};", scroller)
-                time.sleep(0.5)
-            
-            self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", scroller)
-            time.sleep(1.5)
-            
-            results = self._collect_notification_entries()
+            results = list(self.iter_notifications())
             print(f"[✓] {len(results)} notifications")
             return results
         except Exception as e:
             print(f"[!] read_information failed: {e}")
             return []
     
-    def _collect_notification_entries(self):
-        """Collect and parse notification entries from scroller."""
-        items = self.driver.find_elements(*self.NOTIFICATION_LIST_RESULT_ITEM)
+    def iter_notifications(self, max_steps=500):
+        """
+        Stream notifications from the virtualized list, one viewport at a time
         
-        if not items:
-            return []
+        Each step harvests the currently mounted items and scrolls one viewport
+        down in the same script call. Items mounted in more than one viewport
+        are deduplicated by their title and full text, so the "Opened",
+        "Modified" and "Closed" entries of one order are all yielded. The
+        generator stops as soon as the end of the list is reached, so callers
+        can also stop early.
         
-        titles = self._get_notification_titles()
-        results = []
+        Args:
+            max_steps: Safety cap on the number of viewport steps
         
-        for idx, item in enumerate(items):
-            text = item.text.strip()
-            if text:
-                data = self._parse_notification_text(text)
-                data['title'] = titles[idx] if idx < len(titles) else None
-                results.append(data)
+        Yields:
+            Notification: Parsed notification record
+        """
+        self.click_element(self.NOTIFICATION_SELECTOR)
+        self.wait_for_dom_settled(condition=self.NOTIFICATION_LIST_RESULT_ITEM, timeout=5)
+        scroller = self.driver.find_element(*self.NOTIFICATION_SCROLLER)
         
-        return results
+        seen = set()
+        last_top = None
+        for _ in range(max_steps):
+            step = self.driver.execute_script(
+                _JS_HARVEST_NOTIFICATIONS, scroller, list(self.NOTIFICATION_LIST_RESULT_ITEM))
+            parsed = notification_parser.parse_many((item['text'], item['title']) for item in step['items'])
+            for item, data in zip(step['items'], parsed):
+                key = (item['title'], item['text'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield Notification.from_dict(data)
+            if step['atEnd'] or step['top'] == last_top:
+                return
+            last_top = step['top']
+            self.wait_for_dom_settled(region=self.NOTIFICATION_SCROLLER, quiet=0.15, timeout=1)
 
     def _get_notification_titles(self, open_panel=False):
         """Get notification titles."""
         if open_panel:
-            self.driver.find_element(*self.NOTIFICATION_SELECTOR).click()
-            time.sleep(0.3)
+            self.click_element(self.NOTIFICATION_SELECTOR)
+            self.wait_for_dom_settled(condition=self.NOTIFICATION_TITLES, timeout=2)
         
         elements = self.driver.find_elements(*self.NOTIFICATION_TITLES)
         print(f"[DEBUG] Found {len(elements)} notification titles")
@@ -334,30 +1232,7 @@ class WebTradePagePOM(BasePage):
 
     def _parse_notification_text(self, text):
         """Parse notification text to structured data."""
-        data = {'date': None, 'order_id': None, 'symbol': None, 
-                'type': None, 'volume': None, 'profit': None}
-        
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        seen_at = False
-        
-        for line in lines:
-            if line.lower() == 'at':
-                seen_at = True
-            elif re.match(r'\d{4}-\d{2}-\d{2}', line):
-                data['date'] = line.split()[0]
-            elif 'Order No.' in line:
-                if match := re.search(r'Order No\.\s*(\d+)', line):
-                    data['order_id'] = match.group(1)
-                if match := re.search(r'\b([A-Z]{6})\b', line):
-                    data['symbol'] = match.group(1)
-            elif line in ['BUY', 'SELL']:
-                data['type'] = line
-            elif 'volume' in line.lower():
-                if match := re.search(r'(\d+\.\d+)', line):
-                    data['volume'] = match.group(1)
-            elif re.match(r'^[+-]?\d+\.\d+$', line) and not seen_at and not data['profit']:
-                data['profit'] = line
-        return data
+        return notification_parser.parse(text)
 
 
     def edit_position(self, order_id=None, volume=None, stop_loss=None, take_profit=None):
@@ -375,49 +1250,35 @@ class WebTradePagePOM(BasePage):
         """
         try:
             if order_id:
-                scoped_locator = (By.XPATH, f"//div[contains(., '{order_id}')]//button[@data-testid='asset-open-button-edit']")
-                try:
-                    self._click_when_clickable(scoped_locator, timeout=3)
-                    print(f"[✓] Edit button clicked for Order {order_id}")
-                except (TimeoutException, NoSuchElementException):
-                    self._click_when_clickable(self.EDIT_POSITION_BTN)
-                    print(f"[✓] Edit button clicked for Order {order_id} (fallback)")
+                self._click_row_button(order_id, "asset-open-button-edit")
+                print(f"[✓] Edit button clicked for Order {order_id}")
             else:
                 self._click_when_clickable(self.EDIT_POSITION_BTN)
                 print(f"[✓] Edit button clicked")
 
-            time.sleep(0.5)
+            self.wait_for_dom_settled(quiet=0.2, timeout=2)
 
             if volume is not None:
                 try:
                     vol_input = (By.XPATH, "//input[@name='lotSize' or @data-testid='edit-volume-input']")
-                    el = self.driver.find_element(*vol_input)
-                    el.clear()
-                    el.send_keys(str(volume))
+                    self.fill_field(vol_input, str(volume))
                     print(f"[✓] Updated volume: {volume}")
-                    time.sleep(0.2)
                 except Exception as e:
                     print(f"[!] Volume update failed: {e}")
 
             if stop_loss is not None:
                 try:
                     sl_input = (By.XPATH, "//input[@name='stopLoss' or @data-testid='edit-sl-input']")
-                    el = self.driver.find_element(*sl_input)
-                    el.clear()
-                    el.send_keys(f"{float(stop_loss):.2f}")
+                    self.fill_field(sl_input, f"{float(stop_loss):.2f}")
                     print(f"[✓] Updated SL: {stop_loss:.2f}")
-                    time.sleep(0.2)
                 except Exception as e:
                     print(f"[!] SL update failed: {e}")
 
             if take_profit is not None:
                 try:
                     tp_input = (By.XPATH, "//input[@name='takeProfit' or @data-testid='edit-tp-input']")
-                    el = self.driver.find_element(*tp_input)
-                    el.clear()
-                    el.send_keys(f"{float(take_profit):.2f}")
+                    self.fill_field(tp_input, f"{float(take_profit):.2f}")
                     print(f"[✓] Updated TP: {take_profit:.2f}")
-                    time.sleep(0.2)
                 except Exception as e:
                     print(f"[!] TP update failed: {e}")
 
@@ -426,7 +1287,7 @@ class WebTradePagePOM(BasePage):
                     confirm_btn = (By.XPATH, "//button[contains(text(), 'Update') or contains(text(), 'Save') or contains(text(), 'Confirm')]")
                     self._click_when_clickable(confirm_btn, timeout=3)
                     print("[✓] Edit confirmed")
-                    time.sleep(0.5)
+                    self.wait_for_dom_settled(quiet=0.3, timeout=3)
                 except TimeoutException:
                     print("[!] No confirm button found or edit completed")
 
@@ -448,27 +1309,20 @@ class WebTradePagePOM(BasePage):
         """
         try:
             if order_id:
-                scoped_locator = (By.XPATH, f"//div[contains(., '{order_id}')]//button[@data-testid='asset-open-button-close']")
-                try:
-                    self._click_when_clickable(scoped_locator, timeout=3)
-                    print(f"[✓] Close button clicked for Order {order_id}")
-                except (TimeoutException, NoSuchElementException):
-                    self._click_when_clickable(self.CLOSE_POSITION_BTN)
-                    print(f"[✓] Close button clicked for Order {order_id} (fallback)")
+                self._click_row_button(order_id, "asset-open-button-close")
+                print(f"[✓] Close button clicked for Order {order_id}")
             else:
                 self._click_when_clickable(self.CLOSE_POSITION_BTN)
                 print(f"[✓] Close button clicked")
 
-            time.sleep(0.5)
-
             if confirm:
-                confirm_xpath = "//button[contains(text(), 'Close') or contains(text(), 'Confirm') or contains(text(), 'OK')]"
-                try:
-                    self._click_when_clickable((By.XPATH, confirm_xpath), timeout=3)
+                outcome = self._confirm_close(self.CLOSE_CONFIRM_BTN, timeout=3)
+                if outcome == "confirmed":
                     print("[✓] Close confirmed")
-                    time.sleep(1.0)
-                except TimeoutException:
+                elif outcome != "error":
                     print("[✓] Position closed (no confirmation dialog found)")
+            else:
+                self.wait_for_dom_settled(quiet=0.2, timeout=2)
 
             return self
         except Exception as e:
@@ -488,16 +1342,15 @@ class WebTradePagePOM(BasePage):
         try:
             self._click_when_clickable(self.BULK_CLOSE_BTN)
             print("[✓] Bulk close button clicked")
-            time.sleep(0.5)
 
             if confirm:
-                confirm_xpath = "//button[contains(text(), 'Close All') or contains(text(), 'Confirm') or contains(text(), 'OK')]"
-                try:
-                    self._click_when_clickable((By.XPATH, confirm_xpath), timeout=4)
+                outcome = self._confirm_close(self.BULK_CLOSE_CONFIRM_BTN, timeout=4)
+                if outcome == "confirmed":
                     print("[✓] Bulk close confirmed - all positions closed")
-                    time.sleep(1.0)
-                except TimeoutException:
+                elif outcome != "error":
                     print("[*] No confirmation dialog for bulk close")
+            else:
+                self.wait_for_dom_settled(quiet=0.2, timeout=2)
 
             return self
         except Exception as e:
@@ -548,8 +1401,31 @@ class WebTradePagePOM(BasePage):
         
         return result
 
+    def _row_button(self, order_id, testid, timeout=3):
+        """
+        Button with data-testid `testid` in the table row of an order
+        
+        Uses the order ID -> row index kept in the page (built once, updated on
+        table mutations). Waits up to `timeout` for the row to appear.
+        
+        Returns:
+            WebElement or None if no row shows that order
+        """
+        return self.run_async_script(
+            _JS_ROW_BUTTON, list(self.POSITION_CONTAINER), str(order_id).strip(), testid,
+            int(timeout * 1000), timeout=timeout)
+    
+    def _click_row_button(self, order_id, testid, timeout=3):
+        """Click a row button of an order; never falls back to another row"""
+        button = self._row_button(order_id, testid, timeout=timeout)
+        if button is None:
+            raise NoSuchElementException(f"No row for order {order_id} in the table")
+        button.click()
+        return button
+    
     def _click_when_clickable(self, locator, timeout=5):
-        el = self.wait.until(EC.element_to_be_clickable(locator), message=f"{locator} not clickable")
+        el = self.wait_until(OC.element_to_be_clickable(locator), timeout=timeout,
+                             message=f"{locator} not clickable")
         el.click()
         return el
     
\ No newline at end of file
@@ -1,7 +1,10 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 import pytest
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils.chromedriver import get_shared_service
 
 
 @pytest.fixture
@@ -31,7 +34,7 @@ def driver():
     
     # Initialize Chrome WebDriver
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=get_shared_service(),
         options=options
     )
     driver.implicitly_wait(5)
@@ -0,0 +1,211 @@
+"""
+scenarios - Declarative order scenario matrix
+Generates the order test cases (side x order type x action / expiry) from
+the compact spec below and compiles each one into a step plan: a tuple of
+(step, params) pairs run by the step functions in automated_tests.py.
+Every plan starts with the same setup prefix (trade page, then symbol); a
+scenario run on a page the driver pool kept from a passing scenario skips
+the setup they have in common.
+No Selenium or Page Object imports - run this module directly to list,
+filter and inspect plans without loading the browser stack.
+
+Usage:
+    python scenarios.py              # List every scenario with its step plan
+    python scenarios.py "LO-*-00[57]" # Only scenarios whose ID matches the pattern
+"""
+
+from fnmatch import fnmatchcase
+
+
+# Last price multipliers per side: ticket SL/TP and the SL/TP set by an edit
+SIDES = {
+    "BUY": {"sl": 0.99, "tp": 1.03, "edit_sl": 0.98, "edit_tp": 1.04},
+    "SELL": {"sl": 1.01, "tp": 0.97, "edit_sl": 1.02, "edit_tp": 0.96},
+}
+
+# Test ID prefix -> order type
+ORDER_TYPES = {"MO": "Market", "LO": "Limit", "SO": "Stop", "SLO": "Stop Limit"}
+
+# Test number -> (action, expiry, volume factor, title), per order family
+MARKET_ACTIONS = {
+    1: ("entry", None, 1.0, "Standard entry"),
+    2: ("notify", None, 1.0, "Submit & verify notification"),
+    3: ("edit", None, 1.0, "Edit open position"),
+    4: ("close", None, 0.5, "Close position"),
+    5: ("bulk", None, 0.3, "Bulk close positions"),
+}
+PENDING_ACTIONS = {
+    1: ("entry", "Specified Date", 1.0, "Specified Date expiry"),
+    2: ("entry", "Specified Date and Time", 1.0, "Specified Date and Time expiry"),
+    3: ("entry", "Good Till Day", 1.0, "Good Till Day expiry"),
+    4: ("entry", "Good Till Canceled", 1.0, "Good Till Canceled expiry"),
+    5: ("edit", "Good Till Day", 1.0, "Edit pending order (Good Till Day)"),
+    6: ("delete", "Good Till Day", 1.0, "Delete pending order (Good Till Day)"),
+    7: ("bulk", "Specified Date and Time", 0.5, "Bulk close multiple"),
+}
+
+# Expiry types of the order ticket (keys of WebTradePagePOM.EXPIRY_OPTIONS)
+EXPIRY_TYPES = ("Good Till Canceled", "Good Till Day", "Specified Date", "Specified Date and Time")
+
+# Orders placed by a "bulk" scenario before closing them all at once
+BULK_ORDERS = 2
+
+# Leading plan steps that leave the page in a state the next scenario can reuse
+SETUP_STEPS = ("open_trade_page", "select_symbol")
+
+
+def compile_plan(side, order_type, action, expiry=None, volume=1.0):
+    """
+    Compile one point of the matrix into a step plan
+
+    Volumes are factors of the standard test volume and SL/TP values are
+    factors of the last price; both are resolved when the step runs.
+
+    Args:
+        side: "BUY" or "SELL"
+        order_type: Value of ORDER_TYPES
+        action: "entry", "notify", "edit", "close", "delete" or "bulk"
+        expiry: Expiry type for pending orders (None for market orders)
+        volume: Volume factor
+
+    Returns:
+        tuple: (step name, params dict) pairs, setup steps first
+    """
+    prices = SIDES[side]
+    market = order_type == "Market"
+    order = {"side": side, "order_type": order_type, "volume": volume, "expiry": expiry,
+             "sl": prices["sl"], "tp": prices["tp"]}
+
+    plan = [("open_trade_page", {}), ("select_symbol", {})]
+    for _ in range(BULK_ORDERS if action == "bulk" else 1):
+        plan += [("place_order", order), ("verify_order", {"side": side})]
+
+    if action == "notify":
+        plan += [("verify_notification", {}), ("bulk_close", {})]
+    elif action == "edit":
+        edit = {"sl": prices["edit_sl"], "tp": prices["edit_tp"]}
+        if not market:
+            edit["volume"] = volume * 0.5
+        plan += [("edit_order", edit), ("verify_edit", {"tp": prices["edit_tp"]})]
+        plan.append(("bulk_close", {}) if market else ("close_order", {}))
+    elif action == "close":
+        plan += [("close_order", {}), ("bulk_close", {})]
+    elif action == "bulk":
+        plan.append(("bulk_close", {}))
+    else:
+        plan.append(("close_order", {}))
+    return tuple(plan)
+
+
+def step_key(step):
+    """Hashable, printable key of a (name, params) step"""
+    name, params = step
+    if not params:
+        return name
+    return name + "(" + ", ".join(f"{k}={v}" for k, v in sorted(params.items())) + ")"
+
+
+class Scenario:
+    """One generated test case: test ID, runner metadata and its compiled step plan"""
+
+    __slots__ = ("id", "name", "category", "side", "order_type", "action", "expiry", "volume", "_plan")
+
+    def __init__(self, test_id, name, category, side, order_type, action, expiry=None, volume=1.0):
+        self.id = test_id
+        self.name = name
+        self.category = category
+        self.side = side
+        self.order_type = order_type
+        self.action = action
+        self.expiry = expiry
+        self.volume = volume
+        self._plan = None
+
+    @property
+    def plan(self):
+        """Step plan, compiled on first access"""
+        if self._plan is None:
+            self._plan = compile_plan(self.side, self.order_type, self.action, self.expiry, self.volume)
+        return self._plan
+
+    @property
+    def setup_keys(self):
+        """Keys of the leading setup steps of the plan"""
+        keys = []
+        for step in self.plan:
+            if step[0] not in SETUP_STEPS:
+                break
+            keys.append(step_key(step))
+        return keys
+
+    def shared_setup(self, done):
+        """
+        Number of leading setup steps already completed on the page
+
+        Args:
+            done: Setup keys recorded by the previous scenario on the same page
+
+        Returns:
+            int: Steps of the plan that can be skipped
+        """
+        shared = 0
+        for mine, theirs in zip(self.setup_keys, done or ()):
+            if mine != theirs:
+                break
+            shared += 1
+        return shared
+
+    def __repr__(self):
+        return f"Scenario({self.id!r}, {self.name!r})"
+
+
+def build_matrix(expiry_types=EXPIRY_TYPES):
+    """
+    Every order scenario, in suite order (side, order type, test number)
+
+    Args:
+        expiry_types: Expiry types the order ticket accepts
+
+    Raises:
+        ValueError: If a scenario uses an expiry type not in expiry_types
+    """
+    scenarios = []
+    for side in SIDES:
+        for prefix, order_type in ORDER_TYPES.items():
+            actions = MARKET_ACTIONS if order_type == "Market" else PENDING_ACTIONS
+            category = f"{order_type} {side.title()}"
+            for number, (action, expiry, volume, title) in actions.items():
+                if expiry is not None and expiry not in expiry_types:
+                    raise ValueError(f"{prefix}-{side}-{number:03d}: unknown expiry type {expiry!r}")
+                scenarios.append(Scenario(f"{prefix}-{side}-{number:03d}", f"{category} - {title}",
+                                          category, side, order_type, action, expiry, volume))
+    return scenarios
+
+
+SCENARIOS = build_matrix()
+
+
+def select(scenarios=None, pattern=None, category=None):
+    """
+    Filter scenarios by test ID (exact or glob pattern, e.g. "SO-*-00[1-4]") and category
+
+    Returns:
+        list: Matching scenarios, in suite order
+    """
+    return [s for s in (SCENARIOS if scenarios is None else scenarios)
+            if (pattern is None or fnmatchcase(s.id, pattern.upper()))
+            and (category is None or s.category == category)]
+
+
+if __name__ == "__main__":
+    import sys
+
+    chosen = select(pattern=sys.argv[1] if len(sys.argv) > 1 else None)
+    previous = []
+    for scenario in chosen:
+        shared = scenario.shared_setup(previous)
+        print(f"\n{scenario.id:13} {scenario.name}")
+        for index, step in enumerate(scenario.plan):
+            print(f"   {'-' if index < shared else ' '} {step_key(step)}")
+        previous = scenario.setup_keys
+    print(f"\n💡 {len(chosen)} scenarios ('-' = setup shared with the previous scenario)")
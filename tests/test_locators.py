@@ -0,0 +1,54 @@
+"""
+Locator syntax tests (no browser needed)
+Every XPath locator of the Page Objects must at least be well formed - a
+missing bracket only shows up on a live page as "element not found".
+
+Run: python -m pytest tests/test_locators.py
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pages.login_page import LoginPagePOM
+from pages.webtrade_page import WebTradePagePOM
+from utils.locator_audit import collect_locators
+
+_PAIRS = {')': '(', ']': '['}
+
+
+def _unbalanced(xpath):
+    """First bracket problem of an XPath expression (quoted text skipped), or None"""
+    stack = []
+    quote = None
+    for index, char in enumerate(xpath):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in '([':
+            stack.append(char)
+        elif char in _PAIRS:
+            if not stack or stack.pop() != _PAIRS[char]:
+                return f"unexpected '{char}' at {index}"
+    if quote:
+        return "unterminated string"
+    if stack:
+        return f"unclosed '{stack[-1]}'"
+    return None
+
+
+def test_xpath_locators_are_well_formed():
+    problems = {}
+    for page_class in (LoginPagePOM, WebTradePagePOM):
+        for name, (by, selector) in collect_locators(page_class).items():
+            if by == 'xpath' and (problem := _unbalanced(selector)):
+                problems[f"{page_class.__name__}.{name}"] = f"{problem}: {selector}"
+    assert not problems, problems
+
+
+def test_unbalanced_detects_the_usual_typos():
+    assert _unbalanced("(//div[text()='a(b'])[1]") is None
+    assert _unbalanced("//div[@class='x']//div)[2]]") is not None
+    assert _unbalanced("(//div[text()='Good Till Day']/following-sibling::div") is not None
@@ -0,0 +1,96 @@
+"""
+Notification parser tests (no browser needed)
+Checks pages.notification_parser against the line-by-line parser it
+replaced, and the HTML / MHTML extraction of notification items.
+
+Run: python -m pytest tests/test_notification_parser.py
+"""
+
+import os
+import random
+import re
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pages import notification_parser
+
+
+def _legacy_parse(text):
+    """Former WebTradePagePOM._parse_notification_text, kept as the reference"""
+    data = {'date': None, 'order_id': None, 'symbol': None,
+            'type': None, 'volume': None, 'profit': None}
+
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    seen_at = False
+
+    for line in lines:
+        if line.lower() == 'at':
+            seen_at = True
+        elif re.match(r'\d{4}-\d{2}-\d{2}', line):
+            data['date'] = line.split()[0]
+        elif 'Order No.' in line:
+            if match := re.search(r'Order No\.\s*(\d+)', line):
+                data['order_id'] = match.group(1)
+            if match := re.search(r'\b([A-Z]{6})\b', line):
+                data['symbol'] = match.group(1)
+        elif line in ['BUY', 'SELL']:
+            data['type'] = line
+        elif 'volume' in line.lower():
+            if match := re.search(r'(\d+\.\d+)', line):
+                data['volume'] = match.group(1)
+        elif re.match(r'^[+-]?\d+\.\d+$', line) and not seen_at and not data['profit']:
+            data['profit'] = line
+    return data
+
+
+_LINES = (
+    '2026-02-15 10:31:07', '2026-02-15', 'Order No. 123456 XAUUSD', 'Order No.99 EURUSD',
+    'Order No. abc', 'BUY', 'SELL', 'buy', 'Volume 1.00', 'volume: 0.5', 'Volume', 'at',
+    'At', '+12.50', '-3.10', '0.25', '2041.55', '12', 'Position Opened', 'Closed', '',
+    '   ', 'GBPJPY', 'Order No. 7 gold', '  +1.00  ',
+)
+
+
+def _random_text(rng):
+    return '\n'.join(rng.choice(_LINES) for _ in range(rng.randint(0, 12)))
+
+
+def test_parse_matches_legacy_parser():
+    rng = random.Random(2026)
+    for _ in range(20000):
+        text = _random_text(rng)
+        parsed = notification_parser.parse(text, title='t')
+        assert parsed.pop('title') == 't'
+        assert parsed == _legacy_parse(text), text
+
+
+def test_parse_many_accepts_text_and_pairs():
+    text = 'Order No. 5 XAUUSD\nSELL\nVolume 2.00'
+    assert notification_parser.parse_many([text, (text, 'Opened')]) == [
+        notification_parser.parse(text), notification_parser.parse(text, 'Opened')]
+
+
+_ITEM = ('<div data-testid="notification-list-result-item">'
+         '<div data-testid="notification-list-result-item-title">{title}</div>'
+         '{extra}<div>Order No. {order_id} XAUUSD</div><div>BUY</div><div>Volume 1.00</div></div>')
+
+
+def test_void_and_self_closing_tags_do_not_nest():
+    html = ('<section>'
+            + _ITEM.format(title='Opened', order_id=1, extra='<img src="icon.svg"><br><input type="hidden">')
+            + _ITEM.format(title='Closed', order_id=2, extra='<span/><hr/>')
+            + '</section>')
+    items = notification_parser.texts_from_html(html)
+    assert [title for _, title in items] == ['Opened', 'Closed']
+    assert [notification_parser.parse(*item)['order_id'] for item in items] == ['1', '2']
+
+
+def test_parse_mhtml():
+    html = _ITEM.format(title='Opened', order_id=42, extra='<img src="x">')
+    mhtml = ('MIME-Version: 1.0\r\n'
+             'Content-Type: multipart/related; boundary="b"\r\n\r\n'
+             '--b\r\nContent-Type: text/html; charset="utf-8"\r\n\r\n'
+             f'<html><body>{html}</body></html>\r\n--b--\r\n')
+    parsed = notification_parser.parse_mhtml(mhtml)
+    assert [(p['order_id'], p['type'], p['volume'], p['title']) for p in parsed] == [
+        ('42', 'BUY', '1.00', 'Opened')]
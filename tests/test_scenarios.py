@@ -0,0 +1,32 @@
+"""
+Scenario matrix tests (no browser needed)
+Checks the generated order scenarios against the Page Object they drive.
+
+Run: python -m pytest tests/test_scenarios.py
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+import scenarios
+from pages.webtrade_page import WebTradePagePOM
+
+
+def test_expiry_types_match_the_order_ticket():
+    assert set(scenarios.EXPIRY_TYPES) == set(WebTradePagePOM.EXPIRY_OPTIONS)
+    assert scenarios.build_matrix(WebTradePagePOM.EXPIRY_OPTIONS)
+
+
+def test_unknown_expiry_type_fails_the_build(monkeypatch):
+    monkeypatch.setitem(scenarios.PENDING_ACTIONS, 4, ("entry", "Good Till Cancelled", 1.0, "typo"))
+    with pytest.raises(ValueError, match="LO-BUY-004"):
+        scenarios.build_matrix()
+
+
+def test_matrix_ids_are_unique():
+    ids = [scenario.id for scenario in scenarios.SCENARIOS]
+    assert len(ids) == len(set(ids)) == 52
@@ -0,0 +1,170 @@
+"""
+Chromedriver - Cached, offline-capable chromedriver resolution
+Resolves the chromedriver path once per installed Chrome version and keeps it
+in memory and on disk, so no network call is made once the cache is populated.
+Also provides one shared Service (single chromedriver process) for many sessions.
+"""
+
+import atexit
+import functools
+import json
+import os
+
+from selenium.webdriver.chrome.service import Service
+
+
+# On-disk cache: {"<chrome version>": "<chromedriver path>"}
+CACHE_FILE = os.getenv(
+    "CHROMEDRIVER_CACHE_FILE",
+    os.path.join(os.path.expanduser("~"), ".wdm", "aqx_chromedriver_cache.json"),
+)
+
+# Process-wide cache of resolved paths, keyed by Chrome version
+_resolved = {}
+
+# Shared chromedriver service of the current process
+_shared_service = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_chrome_version():
+    """
+    Get the installed Chrome version from the OS (no network)
+
+    Returns:
+        str: Version like "120.0.6099", or None if it cannot be detected
+    """
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, CACHE_FILE)
+    except OSError as e:
+        print(f"[!] Could not write chromedriver cache: {e}")
+
+
+def resolve_driver_path():
+    """
+    Resolve the chromedriver executable path
+
+    Lookup order:
+        1. CHROMEDRIVER_PATH environment variable (air-gapped runners)
+        2. Process-wide cache for the installed Chrome version
+        3. On-disk cache for the installed Chrome version
+        4. ChromeDriverManager().install() (network) - result is cached
+
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    env_path = os.getenv("CHROMEDRIVER_PATH")
+    if env_path:
+        return env_path
+
+    version = get_chrome_version() or "unknown"
+    path = _resolved.get(version)
+    if path:
+        return path
+
+    cache = _load_cache()
+    path = cache.get(version)
+    if path and os.path.isfile(path):
+        _resolved[version] = path
+        return path
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+    except Exception:
+        # Offline and Chrome version unknown/changed - reuse any cached driver still on disk
+        fallback = [p for p in cache.values() if os.path.isfile(p)]
+        if not fallback:
+            raise
+        path = fallback[-1]
+        print(f"[!] Chromedriver download failed, using cached driver: {path}")
+
+    _resolved[version] = path
+    cache[version] = path
+    _save_cache(cache)
+    print(f"[✓] Chromedriver resolved for Chrome {version}: {path}")
+    return path
+
+
+class SharedService(Service):
+    """
+    Chrome Service that keeps one chromedriver process alive for many sessions
+
+    driver.quit() only ends the browser session; the chromedriver process is
+    stopped by shutdown() (see shutdown_shared_service()).
+    """
+
+    def start(self):
+        process = getattr(self, "process", None)
+        if process is not None and process.poll() is None and self.is_connectable():
+            return
+        super().start()
+
+    def stop(self):
+        """Keep chromedriver running - sessions end on driver.quit()"""
+
+    def shutdown(self):
+        """Stop the shared chromedriver process"""
+        if getattr(self, "process", None) is not None:
+            super().stop()
+            self.process = None
+
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
+
+
+def get_shared_service():
+    """
+    Get the process-wide shared chromedriver Service
+
+    Each process (e.g. parallel worker) gets its own chromedriver.
+
+    Returns:
+        SharedService: Service to pass as webdriver.Chrome(service=...)
+    """
+    global _shared_service
+    if _shared_service is None or _shared_service.owner_pid != os.getpid():
+        _shared_service = SharedService(resolve_driver_path())
+        _shared_service.owner_pid = os.getpid()
+    return _shared_service
+
+
+def shutdown_shared_service():
+    """
+    Stop this process's shared chromedriver, if one was started
+
+    Runs at interpreter exit. Worker processes exit via os._exit() and skip
+    atexit handlers, so their initializer registers this with
+    multiprocessing.util.Finalize instead.
+    """
+    global _shared_service
+    service = _shared_service
+    if service is not None and service.owner_pid == os.getpid():
+        service.shutdown()
+        _shared_service = None
+
+
+atexit.register(shutdown_shared_service)
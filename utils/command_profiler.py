@@ -0,0 +1,225 @@
+"""
+CommandProfiler - WebDriver command-level profiler
+Opt-in instrumentation of the driver's command executor: counts every
+chromedriver round-trip per test and per Page Object method, histograms
+latencies and records request/response payload sizes. hook_driver() is the
+suite's only WebDriver command hook; StepTracer reads its command count.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+from pages.base_page import BasePage
+
+
+# Profiler currently recording (None = disabled)
+_active = None
+
+# WebDriver commands issued by hooked drivers in this process
+_command_count = 0
+
+# Latency histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def get_active_profiler():
+    """Return the profiler currently recording, or None"""
+    return _active
+
+
+def command_count():
+    """Number of WebDriver commands issued so far by hooked drivers in this process"""
+    return _command_count
+
+
+def hook_driver(driver):
+    """
+    Wrap the driver's command executor (idempotent, per driver)
+
+    Every command is counted; when a profiler is active it is also timed,
+    sized and recorded.
+
+    Returns:
+        WebDriver: The same driver
+    """
+    executor = driver.command_executor
+    if getattr(executor, "_aqx_profiled", False):
+        return driver
+    original = executor.execute
+
+    def execute(command, params):
+        global _command_count
+        _command_count += 1
+        profiler = _active
+        if profiler is None:
+            return original(command, params)
+        started = time.perf_counter()
+        response = original(command, params)
+        latency = time.perf_counter() - started
+        profiler.record(command, latency, _payload_size(params),
+                        _payload_size(response), _calling_pom_method())
+        return response
+
+    executor.execute = execute
+    executor._aqx_profiled = True
+    return driver
+
+
+class CommandStats:
+    """Aggregated statistics of a group of WebDriver commands"""
+
+    __slots__ = ("count", "total", "max", "request_bytes", "response_bytes", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, latency, request_bytes, response_bytes):
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        ms = latency * 1000
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms < bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 2),
+            "avg_ms": round(self.total * 1000 / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 2),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "histogram_ms": dict(zip([f"<{b}" for b in BUCKETS_MS] + [f">={BUCKETS_MS[-1]}"],
+                                     self.buckets)),
+        }
+
+
+def _payload_size(value):
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _calling_pom_method():
+    """Name of the innermost Page Object method on the call stack (incl. private ones)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, BasePage):
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<test code>"
+
+
+class CommandProfiler:
+    """
+    Records every WebDriver command issued by attached drivers
+
+    Usage:
+        profiler = CommandProfiler().activate()
+        profiler.attach(driver)
+        profiler.current_test = "MO-BUY-001"
+        ...
+        profiler.print_report()
+    """
+
+    def __init__(self):
+        self.current_test = None
+        self.by_command = defaultdict(CommandStats)
+        self.by_method = defaultdict(CommandStats)
+        self.by_test = defaultdict(CommandStats)
+        self.by_method_command = defaultdict(CommandStats)
+
+    def activate(self):
+        global _active
+        _active = self
+        return self
+
+    def deactivate(self):
+        global _active
+        if _active is self:
+            _active = None
+
+    def attach(self, driver):
+        """Hook the driver's command executor (see hook_driver())"""
+        return hook_driver(driver)
+
+    def record(self, command, latency, request_bytes, response_bytes, method):
+        """Add one command to every aggregation"""
+        test = self.current_test or "<no test>"
+        self.by_command[command].add(latency, request_bytes, response_bytes)
+        self.by_method[method].add(latency, request_bytes, response_bytes)
+        self.by_test[test].add(latency, request_bytes, response_bytes)
+        self.by_method_command[f"{method} :: {command}"].add(latency, request_bytes, response_bytes)
+
+    def _groups(self):
+        return {
+            "by_command": self.by_command,
+            "by_method": self.by_method,
+            "by_test": self.by_test,
+            "by_method_command": self.by_method_command,
+        }
+
+    def pop_stats(self):
+        """Return and clear collected stats (used to ship stats out of workers)"""
+        groups = self._groups()
+        self.by_command, self.by_method = defaultdict(CommandStats), defaultdict(CommandStats)
+        self.by_test, self.by_method_command = defaultdict(CommandStats), defaultdict(CommandStats)
+        return groups
+
+    def merge(self, groups):
+        """Merge stats returned by another profiler's pop_stats()"""
+        for group_name, stats in groups.items():
+            target = getattr(self, group_name)
+            for key, stat in stats.items():
+                target[key].merge(stat)
+
+    def to_dict(self):
+        return {name: {k: v.to_dict() for k, v in sorted(group.items(), key=lambda kv: -kv[1].count)}
+                for name, group in self._groups().items()}
+
+    def export(self, directory):
+        """Write commands.json into a directory"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "commands.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        print(f"[✓] Command profile written: {path}")
+        return path
+
+    def print_report(self, top=10):
+        """Print the chattiest Page Object methods and most frequent commands"""
+        total = CommandStats()
+        for stat in self.by_command.values():
+            total.merge(stat)
+        print(f"📡 WebDriver commands: {total.count} in {total.total:.1f}s "
+              f"({total.request_bytes / 1024:.1f} KB sent, {total.response_bytes / 1024:.1f} KB received)")
+        for title, group in (("Chattiest methods", self.by_method),
+                             ("Commands", self.by_command),
+                             ("Method :: command", self.by_method_command)):
+            print(f"   {title}:")
+            for key, stat in sorted(group.items(), key=lambda kv: -kv[1].count)[:top]:
+                print(f"     {stat.count:6d}x {stat.total * 1000:9.0f}ms  max {stat.max * 1000:6.0f}ms  {key}")
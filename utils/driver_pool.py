@@ -0,0 +1,223 @@
+"""
+DriverPool - Reusable pool of warm Chrome WebDriver sessions
+Hands out already started browsers and resets their state between tests
+instead of paying Chrome + chromedriver cold start for every test
+"""
+
+import time
+
+
+# Clears web storage of the page currently loaded in the browser and
+# deletes every IndexedDB database of that origin (async script, gives up
+# after 5s on its own so the driver's script timeout is left untouched)
+_CLEAR_STORAGE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+setTimeout(function () { done(false); }, 5000);
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+if (!window.indexedDB || !indexedDB.databases) { done(true); return; }
+indexedDB.databases().then(function (dbs) {
+    return Promise.all(dbs.map(function (db) {
+        return new Promise(function (resolve) {
+            var req = indexedDB.deleteDatabase(db.name);
+            req.onsuccess = req.onerror = req.onblocked = function () { resolve(); };
+        });
+    }));
+}).then(function () { done(true); }, function () { done(false); });
+"""
+
+
+class DriverPool:
+    """
+    Pool of warm WebDriver sessions
+
+    A session is recycled (quit and replaced by a fresh one) after
+    `max_uses` tests, or as soon as it is released as broken. A session
+    released with the setup its test completed keeps its page, so the next
+    acquire(keep_setup=True) can skip that setup.
+    """
+
+    def __init__(self, factory, max_uses=10, blank_url="about:blank"):
+        """
+        Args:
+            factory: Callable returning a new WebDriver (e.g. setup_driver)
+            max_uses: Number of tests a session may serve before recycling
+            blank_url: Page loaded after reset so the next test starts clean
+        """
+        self.factory = factory
+        self.max_uses = max_uses
+        self.blank_url = blank_url
+        self._idle = []
+        self._uses = {}
+        self._setup = {}
+        self.cold_starts = 0
+        self.cold_start_time = 0.0
+        self.reuses = 0
+        self.reset_time = 0.0
+        self.recycled = 0
+        self.kept = 0
+
+    def acquire(self, keep_setup=False):
+        """
+        Get a ready-to-use driver (warm if available, otherwise cold started)
+
+        Args:
+            keep_setup: Prefer a driver released with setup, handed out as is
+                        (no reset) - read what it completed with take_setup()
+
+        Returns:
+            WebDriver: Driver with clean cookies and web storage, or a kept
+                       driver still on the page its last test left
+        """
+        if keep_setup:
+            for index in range(len(self._idle) - 1, -1, -1):
+                driver = self._idle[index]
+                if id(driver) in self._setup:
+                    del self._idle[index]
+                    self.reuses += 1
+                    self.kept += 1
+                    return driver
+
+        while self._idle:
+            driver = self._idle.pop()
+            self._setup.pop(id(driver), None)
+            started = time.perf_counter()
+            if self._reset(driver):
+                self.reset_time += time.perf_counter() - started
+                self.reuses += 1
+                return driver
+            self._discard(driver)
+
+        started = time.perf_counter()
+        driver = self.factory()
+        self.cold_start_time += time.perf_counter() - started
+        self.cold_starts += 1
+        self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken=False, setup=None):
+        """
+        Return a driver to the pool
+
+        Args:
+            driver: Driver obtained from acquire()
+            broken: True if the test ended with an unexpected error -
+                    the session is then recycled instead of reused
+            setup: Setup steps the test left completed on the current page -
+                   the page is then kept for the next acquire(keep_setup=True)
+        """
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+        self._setup.pop(id(driver), None)
+        if broken or uses >= self.max_uses:
+            self._discard(driver)
+        else:
+            if setup:
+                self._setup[id(driver)] = tuple(setup)
+            self._idle.append(driver)
+
+    def take_setup(self, driver):
+        """
+        Setup steps completed on a driver handed out as is by acquire(keep_setup=True)
+
+        Returns:
+            tuple: Setup keys recorded at release (empty for a reset driver)
+        """
+        return self._setup.pop(id(driver), ())
+
+    def close(self):
+        """Quit every idle driver held by the pool"""
+        while self._idle:
+            self._discard(self._idle.pop(), count=False)
+
+    def _reset(self, driver):
+        """Clear cookies, localStorage, sessionStorage and IndexedDB"""
+        try:
+            current = driver.current_url
+            if current.startswith("http"):
+                driver.execute_async_script(_CLEAR_STORAGE_SCRIPT)
+                try:
+                    origin = "/".join(current.split("/")[:3])
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                           {"origin": origin, "storageTypes": "all"})
+                except Exception:
+                    pass
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.get(self.blank_url)
+            return True
+        except Exception as e:
+            print(f"[!] Driver reset failed, recycling session: {e}")
+            return False
+
+    def _discard(self, driver, count=True):
+        self._uses.pop(id(driver), None)
+        self._setup.pop(id(driver), None)
+        if count:
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def stats(self):
+        """
+        Pool statistics
+
+        Returns:
+            dict: cold_starts, reuses (kept of them without a reset), recycled,
+                  avg_cold_start, avg_reset and time_saved (seconds)
+        """
+        avg_cold = self.cold_start_time / self.cold_starts if self.cold_starts else 0.0
+        resets = self.reuses - self.kept
+        avg_reset = self.reset_time / resets if resets else 0.0
+        return {
+            "cold_starts": self.cold_starts,
+            "reuses": self.reuses,
+            "kept": self.kept,
+            "recycled": self.recycled,
+            "avg_cold_start": avg_cold,
+            "avg_reset": avg_reset,
+            "time_saved": max(0.0, self.reuses * avg_cold - self.reset_time),
+        }
+
+    def print_stats(self):
+        """Print pool statistics in the runner summary format"""
+        print_pool_stats(self.stats())
+
+
+def merge_pool_stats(stats_list):
+    """
+    Combine stats() of several pools (e.g. one per parallel worker)
+
+    Args:
+        stats_list: Iterable of dicts returned by DriverPool.stats()
+
+    Returns:
+        dict: Same keys as DriverPool.stats()
+    """
+    stats_list = list(stats_list)
+    cold_starts = sum(s["cold_starts"] for s in stats_list)
+    reuses = sum(s["reuses"] for s in stats_list)
+    cold_time = sum(s["avg_cold_start"] * s["cold_starts"] for s in stats_list)
+    kept = sum(s["kept"] for s in stats_list)
+    reset_time = sum(s["avg_reset"] * (s["reuses"] - s["kept"]) for s in stats_list)
+    return {
+        "cold_starts": cold_starts,
+        "reuses": reuses,
+        "kept": kept,
+        "recycled": sum(s["recycled"] for s in stats_list),
+        "avg_cold_start": cold_time / cold_starts if cold_starts else 0.0,
+        "avg_reset": reset_time / (reuses - kept) if reuses > kept else 0.0,
+        "time_saved": sum(s["time_saved"] for s in stats_list),
+    }
+
+
+def print_pool_stats(s):
+    """Print a DriverPool.stats() dict in the runner summary format"""
+    print(f"♻️  Driver pool: {s['cold_starts']} cold starts, {s['reuses']} reuses "
+          f"({s['kept']} with the page kept), {s['recycled']} recycled")
+    print(f"⏱️  Avg cold start {s['avg_cold_start']:.2f}s vs avg reset {s['avg_reset']:.2f}s "
+          f"- saved ~{s['time_saved']:.1f}s")
@@ -0,0 +1,161 @@
+"""
+LocatorAudit - Locator cost profiler for Page Object classes
+Evaluates every class-level locator of a POM on the current page in one
+script call, times it, counts matches and flags invalid, missing,
+multi-match and slow selectors. For each locator it also times the POM's
+FAST_LOCATORS alternative (if any) and suggests a data-testid / id / name
+CSS selector for the element that was matched.
+"""
+
+import json
+import os
+
+from pages.conditions import JS_LOCATE
+
+
+# Evaluates each {name, by, sel, alt} entry `repeat` times with performance.now()
+_JS_AUDIT = JS_LOCATE + """
+var entries = arguments[0], repeat = arguments[1];
+function measure(by, sel) {
+    var matches = [], start = performance.now();
+    try {
+        for (var i = 0; i < repeat; i++) matches = __aqxLocate(by, sel);
+    } catch (e) {
+        return {count: 0, ms: null, error: String(e.message || e), matches: []};
+    }
+    return {count: matches.length, ms: (performance.now() - start) / repeat, error: null, matches: matches};
+}
+function innermost(matches) {
+    return matches.filter(function (el) {
+        return !matches.some(function (other) { return other !== el && el.contains(other); });
+    })[0] || null;
+}
+function unique(css) {
+    try { return document.querySelectorAll(css).length === 1; } catch (e) { return false; }
+}
+function suggest(el) {
+    if (!el || el.nodeType !== 1) return null;
+    var tag = el.tagName.toLowerCase(), candidates = [];
+    var testid = el.getAttribute('data-testid');
+    if (testid) candidates.push('[data-testid="' + testid + '"]');
+    if (el.id) candidates.push('#' + CSS.escape(el.id));
+    var name = el.getAttribute('name');
+    if (name) candidates.push(tag + '[name="' + name + '"]');
+    for (var i = 0; i < candidates.length; i++) {
+        if (unique(candidates[i])) return candidates[i];
+    }
+    var parent = el.parentElement;
+    var parentTestid = parent && parent.getAttribute('data-testid');
+    if (parentTestid && unique('[data-testid="' + parentTestid + '"] > ' + tag)) {
+        return '[data-testid="' + parentTestid + '"] > ' + tag;
+    }
+    return null;
+}
+return entries.map(function (entry) {
+    var primary = measure(entry.by, entry.sel);
+    var result = {name: entry.name, count: primary.count, ms: primary.ms, error: primary.error,
+                  suggestion: suggest(innermost(primary.matches)), alternative: null};
+    if (entry.alt) {
+        var alt = measure(entry.alt[0], entry.alt[1]);
+        result.alternative = {count: alt.count, ms: alt.ms, error: alt.error,
+                              same: !!(alt.matches[0] && alt.matches[0] === innermost(primary.matches))};
+    }
+    return result;
+});
+"""
+
+
+def collect_locators(page_class):
+    """Class-level (By, selector) locators of a Page Object class, by attribute name"""
+    locators = {}
+    for klass in reversed(page_class.__mro__):
+        for name, value in vars(klass).items():
+            if (name.isupper() and isinstance(value, tuple) and len(value) == 2
+                    and all(isinstance(part, str) for part in value)):
+                locators[name] = value
+    return locators
+
+
+class LocatorAudit:
+    """Times and checks the locators of Page Object classes on a live (or mock) page"""
+
+    def __init__(self, driver, slow_ms=2.0, repeat=5):
+        """
+        Args:
+            driver: WebDriver instance, already on the page the POM describes
+            slow_ms: Average evaluation time above which a locator is flagged slow
+            repeat: Evaluations per locator (the average is reported)
+        """
+        self.driver = driver
+        self.slow_ms = slow_ms
+        self.repeat = repeat
+        self.results = {}
+
+    def audit(self, page_class, names=None):
+        """
+        Evaluate every locator of a Page Object class on the current page
+
+        Args:
+            page_class: POM class (e.g. WebTradePagePOM)
+            names: Optional subset of locator attribute names
+
+        Returns:
+            list: One dict per locator {name, locator, count, ms, error, flags,
+                  suggestion, alternative}
+        """
+        locators = collect_locators(page_class)
+        fast = getattr(page_class, "FAST_LOCATORS", {})
+        entries = [{"name": name, "by": by, "sel": sel, "alt": list(fast[name]) if name in fast else None}
+                   for name, (by, sel) in locators.items() if names is None or name in names]
+        rows = self.driver.execute_script(_JS_AUDIT, entries, self.repeat)
+
+        for row in rows:
+            row["locator"] = list(locators[row["name"]])
+            if row["name"] in fast:
+                row["alternative"]["locator"] = list(fast[row["name"]])
+            row["flags"] = self._flags(row)
+        self.results[page_class.__name__] = rows
+        return rows
+
+    def _flags(self, row):
+        if row["error"]:
+            return ["invalid"]
+        flags = []
+        if row["count"] == 0:
+            flags.append("no-match")
+        elif row["count"] > 1:
+            flags.append("multi-match")
+        if row["ms"] is not None and row["ms"] >= self.slow_ms:
+            flags.append("slow")
+        return flags
+
+    def to_dict(self):
+        return {"slow_ms": self.slow_ms, "repeat": self.repeat, "pages": self.results}
+
+    def export(self, directory):
+        """Write locators.json into a directory"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "locators.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        print(f"[✓] Locator audit written: {path}")
+        return path
+
+    def print_report(self):
+        """Print every locator, slowest first, with flags and suggested alternatives"""
+        for page, rows in self.results.items():
+            flagged = sum(1 for row in rows if row["flags"])
+            print(f"🔎 {page}: {len(rows)} locators, {flagged} flagged")
+            for row in sorted(rows, key=lambda r: -(r["ms"] or 0)):
+                ms = f"{row['ms']:7.2f}ms" if row["ms"] is not None else "      -  "
+                flags = ",".join(row["flags"]) or "ok"
+                print(f"   {ms} {row['count']:5d}x  {row['name']:<32} {flags}")
+                if row["error"]:
+                    print(f"        error: {row['error']}")
+                alt = row["alternative"]
+                if alt:
+                    alt_ms = f"{alt['ms']:.2f}ms" if alt["ms"] is not None else "invalid"
+                    same = "same element" if alt["same"] else "DIFFERENT element"
+                    print(f"        fast: {alt_ms}, {alt['count']}x, {same}  {alt['locator'][1]}")
+                elif row["suggestion"] and row["flags"]:
+                    print(f"        try:  (By.CSS_SELECTOR, '{row['suggestion']}')")
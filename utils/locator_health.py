@@ -0,0 +1,138 @@
+"""
+LocatorHealthCheck - Pre-flight validation of Page Object locators
+Checks every locator of the given POMs in one in-page pass per page
+(syntax errors, zero matches, multiple matches) and maps broken locators
+to the tests that use them, so the runner can skip or fail those tests
+up front instead of letting each one wait out its timeouts.
+"""
+
+import inspect
+import re
+import time
+
+from utils.locator_audit import LocatorAudit, collect_locators
+
+
+_SELF_ATTR_RE = re.compile(r'self\.([A-Z][A-Z0-9_]*)\b')
+_SELF_CALL_RE = re.compile(r'self\.([a-z_]\w*)\(')
+_CALL_RE = re.compile(r'\.([a-z_]\w*)\(')
+
+
+def method_locators(page_class):
+    """
+    Locators each public method of a POM can reach (directly or via other methods)
+
+    Returns:
+        dict: method name -> set of locator attribute names
+    """
+    locators = collect_locators(page_class)
+    # Class-level maps of locators (e.g. ORDER_TYPE_OPTIONS) count as all of their values
+    by_value = {value: name for name, value in locators.items()}
+    groups = {name: {by_value[v] for v in value.values() if v in by_value}
+              for name, value in vars(page_class).items()
+              if name.isupper() and isinstance(value, dict) and name != "FAST_LOCATORS"}
+
+    direct, calls = {}, {}
+    for name, func in inspect.getmembers(page_class, inspect.isfunction):
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            continue
+        used = set()
+        for attr in _SELF_ATTR_RE.findall(source):
+            if attr in locators:
+                used.add(attr)
+            used |= groups.get(attr, set())
+        direct[name] = used
+        calls[name] = set(_SELF_CALL_RE.findall(source)) - {name}
+
+    resolved = {}
+    for name in direct:
+        seen, stack, used = {name}, [name], set()
+        while stack:
+            current = stack.pop()
+            used |= direct.get(current, set())
+            for callee in calls.get(current, ()):
+                if callee in direct and callee not in seen:
+                    seen.add(callee)
+                    stack.append(callee)
+        resolved[name] = used
+    return {name: used for name, used in resolved.items() if not name.startswith("__")}
+
+
+class LocatorHealthCheck:
+    """Pre-flight check of POM locators and the tests that depend on them"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.audit = LocatorAudit(driver, repeat=1)
+        self.results = {}
+        self.duration = 0.0
+
+    def check(self, page_class):
+        """
+        Check every locator of a POM on the current page
+
+        Returns:
+            dict: {"invalid": {name: error}, "no_match": [names], "multi_match": {name: count}}
+        """
+        started = time.perf_counter()
+        rows = self.audit.audit(page_class)
+        self.duration += time.perf_counter() - started
+        result = {
+            "invalid": {row["name"]: row["error"] for row in rows if row["error"]},
+            "no_match": [row["name"] for row in rows if not row["error"] and row["count"] == 0],
+            "multi_match": {row["name"]: row["count"] for row in rows if row["count"] > 1},
+        }
+        self.results[page_class] = result
+        return result
+
+    def broken(self):
+        """Qualified names ("Class.LOCATOR") of locators that can never match"""
+        return {f"{page_class.__name__}.{name}"
+                for page_class, result in self.results.items()
+                for name in result["invalid"]}
+
+    def blocked_tests(self, test_list):
+        """
+        Tests that call a POM method depending on a broken locator
+
+        Args:
+            test_list: Test case dicts with a "function" key (generated scenario
+                       cases list the step functions they run under "steps")
+
+        Returns:
+            dict: test ID -> sorted list of broken locators it depends on
+        """
+        broken_by_method = {}
+        for page_class, result in self.results.items():
+            if not result["invalid"]:
+                continue
+            for method, used in method_locators(page_class).items():
+                hit = {f"{page_class.__name__}.{name}" for name in used if name in result["invalid"]}
+                if hit:
+                    broken_by_method.setdefault(method, set()).update(hit)
+
+        blocked = {}
+        for test in test_list:
+            try:
+                source = "".join(inspect.getsource(func) for func in test.get("steps") or [test["function"]])
+            except (OSError, TypeError):
+                continue
+            hit = set()
+            for method in set(_CALL_RE.findall(source)):
+                hit |= broken_by_method.get(method, set())
+            if hit:
+                blocked[test["id"]] = sorted(hit)
+        return blocked
+
+    def print_report(self):
+        """Print broken, missing and ambiguous locators per page"""
+        print(f"🩺 Locator pre-flight: {len(self.results)} pages in {self.duration * 1000:.0f}ms")
+        for page_class, result in self.results.items():
+            for name, error in result["invalid"].items():
+                print(f"   ❌ {page_class.__name__}.{name}: {error}")
+            for name in result["no_match"]:
+                print(f"   ⚠️  {page_class.__name__}.{name}: no match on current page")
+            for name, count in result["multi_match"].items():
+                print(f"   ⚠️  {page_class.__name__}.{name}: {count} matches")
@@ -0,0 +1,84 @@
+"""
+NotificationIndex - Hash lookups of positions in the notification list
+Built once from read_information() output, then answers any number of
+position lookups in O(1) each with the same match rules as the old linear
+scan in _match_position_in_information(). Debug output is only produced
+when explain() is called.
+"""
+
+from pages.records import Notification, Position, Record
+
+
+class NotificationIndex:
+    """Indexes of notifications by order_id and by (symbol, type, volume)"""
+
+    def __init__(self, information_list):
+        # Dicts are normalized into typed records once, so lookups compare
+        # ints/Decimals instead of re-normalizing strings per comparison
+        self.entries = [item if isinstance(item, Record) else Notification.from_dict(item)
+                        for item in (information_list or []) if isinstance(item, (dict, Record))]
+        self.by_order_id = {}
+        self.by_key = {}
+        for idx, item in enumerate(self.entries):
+            if item.order_id is not None:
+                self.by_order_id.setdefault(item.order_id, []).append(idx)
+            # Only the first entry per key can ever win a lookup
+            self.by_key.setdefault(item.match_key, idx)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _as_record(position):
+        return position if isinstance(position, Record) else Position.from_dict(position)
+
+    def match(self, position):
+        """
+        Find the notification matching a position
+
+        A notification matches when symbol, type and volume are equal; an
+        order_id match alone is not enough. Like the linear scan, the first
+        matching notification in list order wins, so an exact order_id match
+        is reported as "perfect" and any other as "fallback".
+
+        Args:
+            position: Position record (or dict) from the position table
+
+        Returns:
+            tuple: (Notification, "perfect" | "fallback"), or (None, None)
+        """
+        if not position or not self.entries:
+            return None, None
+        position = self._as_record(position)
+        idx = self.by_key.get(position.match_key)
+        if idx is None:
+            return None, None
+        item = self.entries[idx]
+        kind = "perfect" if position.order_id is not None and position.order_id == item.order_id else "fallback"
+        return item, kind
+
+    def explain(self, position):
+        """
+        Describe how a position was (or was not) matched
+
+        Returns:
+            list: Debug lines - the position fields, notifications sharing its
+                  order_id with the fields that differ, and the match result
+        """
+        position = self._as_record(position)
+        key = position.match_key
+        lines = [f"Position: Order ID={position.order_id}, Symbol={key[0]}, Type={key[1]}, Volume={key[2]}",
+                 f"Indexed {len(self.entries)} notifications"]
+        for idx in self.by_order_id.get(position.order_id, []):
+            item = self.entries[idx]
+            diffs = [f"{name}: {mine} vs {theirs}"
+                     for name, mine, theirs in zip(("Symbol", "Type", "Volume"), key, item.match_key)
+                     if mine != theirs]
+            status = "all fields match" if not diffs else "partial - " + ", ".join(diffs)
+            lines.append(f"[{idx + 1}] Order ID match ({status}), Title={item.title}")
+        item, kind = self.match(position)
+        if item is None:
+            lines.append("✗ NO MATCH FOUND")
+        else:
+            lines.append(f"✓ {kind.upper()} MATCH: [{self.by_key[key] + 1}] {item.title}")
+        return lines
@@ -0,0 +1,163 @@
+"""
+SessionCache - Authenticated session snapshots to skip the UI login
+Logs in through the UI once per account, captures cookies and web storage,
+and injects them into later drivers so tests start directly on /web/trade.
+Expired or rejected snapshots transparently fall back to a real login.
+"""
+
+import time
+from urllib.parse import urlparse
+
+from pages.login_page import LoginPagePOM
+from pages.webtrade_page import WebTradePagePOM
+
+
+_READ_STORAGE_SCRIPT = """
+function dump(storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        out[key] = storage.getItem(key);
+    }
+    return out;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_WRITE_STORAGE_SCRIPT = """
+var snap = arguments[0];
+Object.keys(snap.local).forEach(function (k) { window.localStorage.setItem(k, snap.local[k]); });
+Object.keys(snap.session).forEach(function (k) { window.sessionStorage.setItem(k, snap.session[k]); });
+"""
+
+
+class SessionSnapshot:
+    """Cookies and web storage captured right after a successful login"""
+
+    def __init__(self, origin, cookies, local_storage, session_storage):
+        self.origin = origin
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.captured_at = time.time()
+
+    def is_expired(self, max_age):
+        """
+        Check snapshot age and cookie expiry
+
+        Args:
+            max_age: Maximum snapshot age in seconds
+
+        Returns:
+            bool: True if the snapshot must not be injected anymore
+        """
+        now = time.time()
+        if now - self.captured_at > max_age:
+            return True
+        return any(c.get("expiry") is not None and c["expiry"] <= now for c in self.cookies)
+
+
+class SessionCache:
+    """
+    Per-account cache of authenticated session snapshots
+
+    Usage:
+        cache = SessionCache()
+        webtrade = cache.open_trade_page(driver, username, password)
+    """
+
+    def __init__(self, max_age=30 * 60, timeout=10):
+        """
+        Args:
+            max_age: Seconds after which a snapshot is considered expired
+            timeout: Seconds to wait for the trade page after injection
+        """
+        self.max_age = max_age
+        self.timeout = timeout
+        self._snapshots = {}
+        self.injected = 0
+        self.ui_logins = 0
+
+    def open_trade_page(self, driver, username, password):
+        """
+        Open /web/trade as an authenticated user
+
+        Injects the cached snapshot when valid; otherwise (no snapshot, expired,
+        or rejected by the server) performs a real UI login and captures a new one.
+
+        Args:
+            driver: WebDriver instance
+            username: Login username
+            password: Login password
+
+        Returns:
+            WebTradePagePOM: Trading page ready for actions
+        """
+        webtrade = WebTradePagePOM(driver)
+        snapshot = self._snapshots.get(username)
+
+        if snapshot and not snapshot.is_expired(self.max_age):
+            if self._inject(driver, snapshot, webtrade):
+                self.injected += 1
+                print(f"[✓] Session restored from snapshot for {username}")
+                return webtrade
+            print(f"[!] Session snapshot rejected for {username} - logging in via UI")
+        elif snapshot:
+            print(f"[!] Session snapshot expired for {username} - logging in via UI")
+        self._snapshots.pop(username, None)
+
+        login_page = LoginPagePOM(driver)
+        login_page.open_page()
+        assert login_page.verify_page_loaded(), "Login page should load"
+        login_page.login(username, password)
+        assert login_page.wait_for_success(), "Login should succeed"
+        self.ui_logins += 1
+
+        self._snapshots[username] = self.capture(driver)
+        return webtrade
+
+    def capture(self, driver):
+        """
+        Capture cookies and web storage of the current (logged-in) page
+
+        Returns:
+            SessionSnapshot: Snapshot for the current origin
+        """
+        parsed = urlparse(driver.current_url)
+        storage = driver.execute_script(_READ_STORAGE_SCRIPT)
+        return SessionSnapshot(
+            origin=f"{parsed.scheme}://{parsed.netloc}",
+            cookies=driver.get_cookies(),
+            local_storage=storage.get("local", {}),
+            session_storage=storage.get("session", {}),
+        )
+
+    def invalidate(self, username=None):
+        """Drop the snapshot of one account, or all snapshots"""
+        if username is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(username, None)
+
+    def _inject(self, driver, snapshot, webtrade):
+        """Load the snapshot into the driver and open the trade page"""
+        try:
+            # Cookies and storage can only be set for the origin currently loaded
+            driver.get(snapshot.origin + "/favicon.ico")
+            driver.delete_all_cookies()
+            for cookie in snapshot.cookies:
+                cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
+                driver.add_cookie(cookie)
+            driver.execute_script(_WRITE_STORAGE_SCRIPT, {
+                "local": snapshot.local_storage,
+                "session": snapshot.session_storage,
+            })
+
+            webtrade.open_page(redirect=LoginPagePOM.LOGIN_FORM, timeout=self.timeout)
+            # Server rejected the session and redirected to the login form
+            if "/web/trade" not in urlparse(driver.current_url).path:
+                return False
+            return webtrade.verify_page_loaded()
+        except Exception as e:
+            print(f"[!] Session injection failed: {e}")
+            return False
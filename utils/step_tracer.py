@@ -0,0 +1,205 @@
+"""
+StepTracer - Per-step timing instrumentation for Page Object methods
+Wraps every public POM method in a timing span (name, arguments, duration,
+number of WebDriver commands) nested under the running test ID, and exports
+the run as JSON or as Chrome trace-event format (chrome://tracing, Perfetto).
+Commands are counted by the command profiler's driver hook
+(command_profiler.hook_driver), which the runner installs on every driver.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.command_profiler import command_count
+
+
+# Tracer currently recording (None = instrumentation is a no-op)
+_active = None
+
+# Arguments whose values are never recorded
+_SECRET_ARGS = ("password", "secret", "token")
+
+
+def get_active_tracer():
+    """Return the tracer currently recording, or None"""
+    return _active
+
+
+def _format_args(fn, args, kwargs):
+    """Bind call arguments to parameter names, masking secrets and long values"""
+    try:
+        bound = inspect.signature(fn).bind(None, *args, **kwargs)
+    except TypeError:
+        return {"args": [repr(a)[:80] for a in args]}
+    out = {}
+    for name, value in list(bound.arguments.items())[1:]:
+        if any(secret in name.lower() for secret in _SECRET_ARGS):
+            out[name] = "***"
+        else:
+            out[name] = repr(value)[:80]
+    return out
+
+
+def _traced(cls_name, name, fn):
+    @functools.wraps(fn)
+    def traced(self, *args, **kwargs):
+        tracer = _active
+        if tracer is None:
+            return fn(self, *args, **kwargs)
+        with tracer.span(f"{cls_name}.{name}", _format_args(fn, args, kwargs)):
+            return fn(self, *args, **kwargs)
+
+    traced.__traced__ = True
+    return traced
+
+
+def instrument(*classes):
+    """
+    Wrap every public method of the given Page Object classes (idempotent)
+
+    Inherited BasePage helpers (click, type, ...) are wrapped too.
+
+    Args:
+        classes: Page Object classes, e.g. LoginPagePOM, WebTradePagePOM
+    """
+    for cls in classes:
+        for name, fn in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith("_") or getattr(fn, "__traced__", False):
+                continue
+            setattr(cls, name, _traced(cls.__name__, name, fn))
+
+
+class StepTracer:
+    """
+    Records nested timing spans
+
+    Usage:
+        tracer = StepTracer().activate()
+        with tracer.test("MO-BUY-001"):
+            ...  # instrumented POM calls become child spans
+        tracer.export("profile/")
+    """
+
+    def __init__(self, epoch=None):
+        """
+        Args:
+            epoch: perf_counter() value used as time zero - pass the parent's
+                   epoch to worker processes so their spans line up
+        """
+        self.epoch = time.perf_counter() if epoch is None else epoch
+        self.spans = []
+        self._stack = []
+
+    def activate(self):
+        """Make this the recording tracer"""
+        global _active
+        _active = self
+        return self
+
+    def deactivate(self):
+        global _active
+        if _active is self:
+            _active = None
+
+    @property
+    def current(self):
+        """Innermost open span (dict) or None"""
+        return self._stack[-1] if self._stack else None
+
+    @contextmanager
+    def span(self, name, args=None, category="step"):
+        """
+        Record a timing span
+
+        Args:
+            name: Span name (e.g. "WebTradePagePOM.click_buy")
+            args: Dict of recorded arguments
+            category: "test" for test roots, "step" for POM methods
+        """
+        span = {
+            "name": name,
+            "cat": category,
+            "args": args or {},
+            "start": time.perf_counter() - self.epoch,
+            "duration": None,
+            "commands": 0,
+            "error": None,
+            "children": [],
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        parent = self.current
+        (parent["children"] if parent else self.spans).append(span)
+        self._stack.append(span)
+        commands_before = command_count()
+        try:
+            yield span
+        except BaseException as e:
+            span["error"] = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            span["duration"] = time.perf_counter() - self.epoch - span["start"]
+            span["commands"] = command_count() - commands_before
+            self._stack.pop()
+
+    def test(self, test_id, name=None):
+        """Root span for one test from TEST_CASES"""
+        return self.span(test_id, {"name": name} if name else None, category="test")
+
+    def pop_spans(self):
+        """Return and clear finished root spans (used to ship spans out of workers)"""
+        spans, self.spans = self.spans, []
+        return spans
+
+    def to_json(self):
+        """Nested spans as a JSON string (durations in seconds)"""
+        return json.dumps({"spans": self.spans}, indent=2)
+
+    def to_trace_events(self):
+        """
+        Spans as Chrome trace-event format
+
+        Returns:
+            dict: {"traceEvents": [...]} with complete ("X") events in microseconds
+        """
+        events = []
+
+        def walk(span):
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round((span["duration"] or 0) * 1e6),
+                "pid": span["pid"],
+                "tid": span["tid"],
+                "args": dict(span["args"], commands=span["commands"], error=span["error"]),
+            })
+            for child in span["children"]:
+                walk(child)
+
+        for root in self.spans:
+            walk(root)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, directory):
+        """
+        Write steps.json and trace.json into a directory
+
+        Returns:
+            tuple: (steps_path, trace_path)
+        """
+        os.makedirs(directory, exist_ok=True)
+        steps_path = os.path.join(directory, "steps.json")
+        trace_path = os.path.join(directory, "trace.json")
+        with open(steps_path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_trace_events(), f)
+        print(f"[✓] Step profile written: {steps_path}, {trace_path}")
+        return steps_path, trace_path